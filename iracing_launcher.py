@@ -4,12 +4,22 @@ iRacing Companion Launcher - Main Entry Point
 A modern GUI application to launch and manage iRacing companion apps.
 """
 
-import customtkinter as ctk
-from iracing_launcher_app.ui.main_window import iRacingLauncherGUI
+import logging
 
 
 def main():
     """Application entry point."""
+    # Debug output from path searches and launches is dropped unless
+    # the level is lowered here
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+    # Imported here so the GUI stack is only loaded when actually launching
+    import customtkinter as ctk
+    from iracing_launcher_app.ui.main_window import iRacingLauncherGUI
+
     # Set appearance mode and color theme
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
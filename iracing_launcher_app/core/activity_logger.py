@@ -6,16 +6,37 @@ the activity log text widget and formatting.
 """
 
 import time
-import customtkinter as ctk
-from typing import Optional
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING, Deque, Optional, Tuple
 
 from ..ui.constants import LOG_COLORS
 
+if TYPE_CHECKING:
+    # Only needed for annotations; the widget is passed in by the UI
+    import customtkinter as ctk
+
+
+# (level, color) pairs configured as text tags on the log widget
+_LOG_TAGS = tuple(LOG_COLORS.items())
+
+# Text of the separator inserted by log_divider
+DIVIDER_LINE = "─" * 50
+
 
 class ActivityLogger:
     """Manages activity logging to a CTkTextbox widget."""
 
-    def __init__(self, log_widget: Optional[ctk.CTkTextbox] = None):
+    # Coalesce log lines arriving within this many ms into one widget update
+    FLUSH_DELAY_MS = 16
+
+    # Oldest lines are dropped once the log holds more than this many,
+    # LOG_TRIM_LINES extra at a time so trimming isn't needed every flush
+    MAX_LOG_LINES = 500
+    LOG_TRIM_LINES = 100
+
+    def __init__(self, log_widget: Optional["ctk.CTkTextbox"] = None):
         """
         Initialize the activity logger.
 
@@ -23,15 +44,33 @@ class ActivityLogger:
             log_widget: Optional CTkTextbox widget for displaying logs
         """
         self.log_widget = log_widget
-        self._configure_tags()
+        # (level tag, "[HH:MM:SS] " prefix or "", line text without newline)
+        self._pending: Deque[Tuple[str, str, str]] = deque()
+        self._flush_scheduled = False
+        self._prefix_cache = (0, "")  # (epoch second, "[HH:MM:SS] ")
+        self._tagged_widget = None  # Widget whose tags are already set up
+        self._batch_depth = 0  # > 0 while inside begin_batch()/end_batch()
+        self._line_count = 0  # Lines currently in the widget
 
     def _configure_tags(self):
-        """Configure text tags for colored log messages."""
-        if self.log_widget:
-            for level, color in LOG_COLORS.items():
-                self.log_widget.tag_config(level, foreground=color)
-
-    def set_widget(self, log_widget: ctk.CTkTextbox):
+        """Configure text tags for colored log messages, once per widget."""
+        if self.log_widget and self.log_widget is not self._tagged_widget:
+            # CTkTextbox wraps a tk.Text; configure every tag in one Tcl eval
+            # on it rather than one tag_config round trip per level
+            textbox = getattr(self.log_widget, "_textbox", None)
+            if textbox is not None:
+                textbox.tk.eval("\n".join(
+                    f"{textbox} tag configure {level} -foreground {color}"
+                    for level, color in _LOG_TAGS
+                ))
+            else:
+                for level, color in _LOG_TAGS:
+                    self.log_widget.tag_config(level, foreground=color)
+            self._tagged_widget = self.log_widget
+            # "end-1c" is on the line after the last newline
+            self._line_count = int(self.log_widget.index("end-1c").split(".")[0]) - 1
+
+    def set_widget(self, log_widget: "ctk.CTkTextbox"):
         """
         Set or update the log widget.
 
@@ -39,7 +78,77 @@ class ActivityLogger:
             log_widget: CTkTextbox widget for displaying logs
         """
         self.log_widget = log_widget
+
+    def _enqueue(self, level: str, prefix: str, text: str):
+        """
+        Queue a line for the log widget and make sure a flush will happen.
+
+        Args:
+            level: Tag used to color the line
+            prefix: "[HH:MM:SS] " timestamp prefix, or "" for none
+            text: Line text without the trailing newline
+        """
+        self._pending.append((level, prefix, text))
+
+        if self._batch_depth:
+            return
+        # Launches and closes run off the Tk thread, so the event loop is
+        # free to run this promptly; at most one redraw per frame
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.log_widget.after(self.FLUSH_DELAY_MS, self._flush)
+
+    def begin_batch(self):
+        """
+        Hold back log output until the matching end_batch().
+
+        Calls may nest; output is written when the outermost batch ends.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """Write everything logged since begin_batch() in one update."""
+        self._batch_depth = max(self._batch_depth - 1, 0)
+        if self._batch_depth or not self.log_widget:
+            return
+        self._flush()
+        self.log_widget.update_idletasks()
+
+    def _flush(self):
+        """Write all queued text to the widget in one edit."""
+        self._flush_scheduled = False
+        if not self._pending or not self.log_widget:
+            self._pending.clear()
+            return
+
+        # Deferred until there is something to show
         self._configure_tags()
+        self.log_widget.configure(state="normal")
+
+        # Only follow new output if the user hasn't scrolled up to read
+        at_bottom = self.log_widget.yview()[1] >= 0.99
+
+        # One joined string and one insert per run of same-level lines
+        insert = self.log_widget.insert
+        for level, run in groupby(self._pending, key=itemgetter(0)):
+            parts = []
+            for _, prefix, text in run:
+                parts += (prefix, text, "\n")
+            blob = "".join(parts)
+            insert("end", blob, level)
+            self._line_count += blob.count("\n")
+        self._pending.clear()
+
+        # Keep the widget's text bounded by dropping the oldest lines
+        if self._line_count > self.MAX_LOG_LINES:
+            excess = self._line_count - self.MAX_LOG_LINES + self.LOG_TRIM_LINES
+            self.log_widget.delete("1.0", f"{excess + 1}.0")
+            self._line_count -= excess
+
+        if at_bottom:
+            # Jump straight to the bottom; see("end") computes the line's bbox first
+            self.log_widget.yview_moveto(1.0)
+        self.log_widget.configure(state="disabled")
 
     def log_message(self, message: str, level: str = "info"):
         """
@@ -52,37 +161,29 @@ class ActivityLogger:
         if not self.log_widget:
             return
 
-        self.log_widget.configure(state="normal")
-
-        timestamp = time.strftime("%H:%M:%S")
-        # Insert the message with colored text using tags
-        self.log_widget.insert("end", f"[{timestamp}] {message}\n", level)
-
-        self.log_widget.see("end")
-        self.log_widget.configure(state="disabled")
-
-        # Force update to show message immediately
-        if hasattr(self.log_widget, 'master'):
-            self.log_widget.master.update()
+        # Lines within the same second share one formatted prefix
+        now = int(time.time())
+        if now != self._prefix_cache[0]:
+            self._prefix_cache = (now, time.strftime("[%H:%M:%S] ", time.localtime(now)))
+        self._enqueue(level, self._prefix_cache[1], message)
 
     def log_divider(self):
         """Add a visual divider line to the activity log."""
         if not self.log_widget:
             return
 
-        self.log_widget.configure(state="normal")
-        self.log_widget.insert("end", "─" * 50 + "\n", "divider")
-        self.log_widget.see("end")
-        self.log_widget.configure(state="disabled")
+        self._enqueue("divider", "", DIVIDER_LINE)
 
     def clear_log(self):
         """Clear all text from the activity log."""
         if not self.log_widget:
             return
 
+        self._pending.clear()
         self.log_widget.configure(state="normal")
         self.log_widget.delete("1.0", "end")
         self.log_widget.configure(state="disabled")
+        self._line_count = 0
 
     def info(self, message: str):
         """Log an info message."""
@@ -5,96 +5,126 @@ This module contains the configuration data for all supported
 companion applications and racing simulators.
 """
 
-# Application definitions
-APPS = {
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class AppSpec:
+    """An app definition resolved for this machine by AppManager."""
+
+    name: str
+    exe: str
+    exe_lower: str  # For matching against process names
+    config_key: str  # Key of the saved path in config.ini
+    shortcut_names: Tuple[str, ...]
+    paths: Tuple[str, ...]  # Dynamic paths first, then hardcoded ones
+    existing_paths: Tuple[str, ...]  # Entries of paths that exist
+
+
+# Application definitions (read-only; managers work on their own copies)
+APPS = MappingProxyType({
     "Fanatec": {
         "exe": "Fanatec.exe",
-        "shortcut_names": ["Fanatec.lnk", "Fanatec Control Panel.lnk"],
-        "paths": [
+        "shortcut_names": ("Fanatec.lnk", "Fanatec Control Panel.lnk"),
+        "paths": (
             r"C:\Program Files\Fanatec\FanatecUI\UI\Fanatec.exe",
             r"C:\Program Files (x86)\Fanatec\FanatecUI\UI\Fanatec.exe"
-        ]
+        )
     },
     "Crew Chief V4": {
         "exe": "CrewChiefV4.exe",
-        "shortcut_names": ["Crew Chief V4.lnk", "CrewChiefV4.lnk"],
-        "paths": [
+        "shortcut_names": ("Crew Chief V4.lnk", "CrewChiefV4.lnk"),
+        "paths": (
             r"C:\Program Files (x86)\Britton IT Ltd\CrewChiefV4\CrewChiefV4.exe",
             r"C:\Program Files\Britton IT Ltd\CrewChiefV4\CrewChiefV4.exe"
-        ]
+        )
     },
     "Trading Paints": {
         "exe": "Trading Paints.exe",
-        "shortcut_names": ["Trading Paints.lnk"],
-        "paths": [
+        "shortcut_names": ("Trading Paints.lnk",),
+        "paths": (
             r"C:\Program Files (x86)\Rhinode LLC\Trading Paints\Trading Paints.exe",
             r"C:\Program Files\Rhinode LLC\Trading Paints\Trading Paints.exe"
-        ]
+        )
     },
     "SimHub": {
         "exe": "SimHubWPF.exe",
-        "shortcut_names": ["SimHub.lnk"],
-        "paths": [
+        "shortcut_names": ("SimHub.lnk",),
+        "paths": (
             r"C:\Program Files (x86)\SimHub\SimHubWPF.exe",
             r"C:\Program Files\SimHub\SimHubWPF.exe"
-        ]
+        )
     },
     "Garage61": {
         "exe": "garage61-launcher.exe",
-        "shortcut_names": ["Garage 61 Telemetry Agent.lnk", "Garage61.lnk", "garage61.lnk"],
-        "paths": []  # Will be populated at runtime
+        "shortcut_names": ("Garage 61 Telemetry Agent.lnk", "Garage61.lnk", "garage61.lnk"),
+        "paths": (),
+        # (environment variable, path below it), resolved at runtime
+        "dynamic_paths": (
+            ("APPDATA", r"garage61-install\garage61-launcher.exe"),
+        )
     },
     "Elgato Stream Deck": {
         "exe": "StreamDeck.exe",
-        "shortcut_names": ["Elgato Stream Deck.lnk", "Stream Deck.lnk"],
-        "paths": [
-            r"C:\Program Files\Elgato\StreamDeck\StreamDeck.exe"
-        ]
+        "shortcut_names": ("Elgato Stream Deck.lnk", "Stream Deck.lnk"),
+        "paths": (
+            r"C:\Program Files\Elgato\StreamDeck\StreamDeck.exe",
+        )
     },
     "TrackTitan": {
         "exe": "TrackTitanDesktopApplication.exe",
-        "shortcut_names": ["TrackTitanDesktopApplication.lnk"],
-        "paths": []  # Will be populated at runtime
+        "shortcut_names": ("TrackTitanDesktopApplication.lnk",),
+        "paths": (),
+        "dynamic_paths": (
+            ("LOCALAPPDATA", r"Programs\track-titan-ghost-application\TrackTitanDesktopApplication.exe"),
+        )
     }
-}
+})
 
-# Race Games definitions
-RACE_GAMES = {
+# Race Games definitions (read-only; managers work on their own copies)
+RACE_GAMES = MappingProxyType({
     "iRacing": {
         "exe": "iRacingUI.exe",
-        "shortcut_names": ["iRacing.lnk", "iRacing Simulator.lnk"],
+        "shortcut_names": ("iRacing.lnk", "iRacing Simulator.lnk"),
         "steam_appid": "266410",
         "steam_folder": "iRacing",
-        "paths": [
+        "paths": (
             r"C:\Program Files (x86)\iRacing\iRacingLauncher64.exe",
-        ]
+        )
     },
     "Assetto Corsa Competizione": {
         "exe": "AC2-Win64-Shipping.exe",
-        "shortcut_names": ["Assetto Corsa Competizione.lnk"],
+        "shortcut_names": ("Assetto Corsa Competizione.lnk",),
         "steam_appid": "805550",
         "steam_folder": "Assetto Corsa Competizione",
-        "paths": []  # Will check Steam libraries
+        "paths": ()  # Will check Steam libraries
     },
     "Assetto Corsa Evo": {
         "exe": "AssettoCorsaEVO.exe",  # May need verification
-        "shortcut_names": ["Assetto Corsa Evo.lnk"],
+        "shortcut_names": ("Assetto Corsa Evo.lnk",),
         "steam_appid": "3058630",
         "steam_folder": "Assetto Corsa Evo",
-        "paths": []  # Will check Steam libraries
+        "paths": ()  # Will check Steam libraries
     },
     "Automobilista 2": {
         "exe": "AMS2AVX.exe",
-        "shortcut_names": ["Automobilista 2.lnk"],
+        "shortcut_names": ("Automobilista 2.lnk",),
         "steam_appid": "1066890",
         "steam_folder": "Automobilista 2",
-        "paths": []  # Will check Steam libraries
+        "paths": ()  # Will check Steam libraries
     },
     "rFactor 2": {
         "exe": "rFactor2.exe",
-        "shortcut_names": ["rFactor 2.lnk"],
+        "shortcut_names": ("rFactor 2.lnk",),
         "steam_appid": "365960",
         "steam_folder": "rFactor 2",
-        "paths": []  # Will check Steam libraries
+        "paths": ()  # Will check Steam libraries
     }
-}
+})
+
+# Display name -> config.ini key, for every known app and game
+CONFIG_KEYS = MappingProxyType({
+    name: name.lower().replace(" ", "_") for name in (*APPS, *RACE_GAMES)
+})
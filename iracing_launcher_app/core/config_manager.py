@@ -2,10 +2,18 @@
 Configuration file management for storing application paths.
 """
 
+import atexit
+import functools
+import io
 import os
 import sys
-import configparser
-from typing import Optional
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .app_definitions import CONFIG_KEYS
+from .ini_config import IniConfig
 
 
 class ConfigManager:
@@ -14,17 +22,41 @@ class ConfigManager:
     CONFIG_FILENAME = "config.ini"
     SECTION_NAME = "AppPaths"
     SETTINGS_SECTION = "Settings"
+    SHORTCUT_CACHE_SECTION = "ShortcutCache"
+    NOT_FOUND_SECTION = "NotFound"
+    LAST_BROWSE_SECTION = "LastBrowse"
+
+    # How long (seconds) a saved path's existence check is reused
+    EXISTS_TTL = 5.0
+
+    # Config directory, resolved on first use; it can't change while running
+    _config_dir: Optional[str] = None
 
     def __init__(self):
         """Initialize the config manager and load existing config."""
-        self.config = configparser.ConfigParser()
+        self.config = IniConfig()
         self.config_dir = self._resolve_config_dir()
         self.config_path = os.path.join(self.config_dir, self.CONFIG_FILENAME)
+        self._dirty = False  # Unsaved changes from set_* calls
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}  # path -> (checked at, exists)
+        self._mtime: Optional[float] = None  # config.ini mtime when last read/written
+        # Path checks run on worker threads while the Tk thread saves, so
+        # every change to self.config and every save holds this lock
+        self._lock = threading.RLock()
         self._load_config()
+        # Anything not saved explicitly is written once on exit
+        atexit.register(self.flush)
 
-    @staticmethod
-    def _resolve_config_dir() -> str:
+    @classmethod
+    def _resolve_config_dir(cls) -> str:
         """Resolve the directory where config and other state files live."""
+        if cls._config_dir is None:
+            cls._config_dir = cls._compute_config_dir()
+        return cls._config_dir
+
+    @staticmethod
+    def _compute_config_dir() -> str:
+        """Work out (and create if needed) the config directory."""
         if getattr(sys, 'frozen', False):
             # Running as compiled executable - use AppData folder
             # This avoids permission issues when installed to Program Files
@@ -45,10 +77,25 @@ class ConfigManager:
         return self.config_dir
 
     def _load_config(self):
-        """Load configuration from config.ini."""
-        if os.path.exists(self.config_path):
+        """Load configuration from config.ini, unless it is unchanged since the last load."""
+        with self._lock:
+            self._load_config_locked()
+
+    def _load_config_locked(self):
+        """Body of _load_config; the caller holds self._lock."""
+        try:
+            mtime = os.stat(self.config_path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self._mtime:
+            return
+
+        if mtime is not None:
+            config = IniConfig()
             try:
-                self.config.read(self.config_path)
+                config.read(self.config_path)
+                self.config = config
+                self._mtime = mtime
             except Exception as e:
                 print(f"Warning: Error loading config: {e}")
 
@@ -57,6 +104,28 @@ class ConfigManager:
             self.config[self.SECTION_NAME] = {}
         if self.SETTINGS_SECTION not in self.config:
             self.config[self.SETTINGS_SECTION] = {}
+        if self.SHORTCUT_CACHE_SECTION not in self.config:
+            self.config[self.SHORTCUT_CACHE_SECTION] = {}
+        # Failed searches were once persisted here; they're now only
+        # remembered for the current session
+        self.config.remove_section(self.NOT_FOUND_SECTION)
+        if self.LAST_BROWSE_SECTION not in self.config:
+            self.config[self.LAST_BROWSE_SECTION] = {}
+
+    def reload(self) -> bool:
+        """
+        Re-read config.ini if it changed on disk since it was last read or saved.
+
+        Unsaved changes take precedence, so nothing is reloaded while dirty.
+
+        Returns:
+            True if the in-memory config is now in sync with the file
+        """
+        with self._lock:
+            if self._dirty:
+                return False
+            self._load_config_locked()
+            return True
 
     def save_config(self) -> bool:
         """
@@ -65,14 +134,43 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        with self._lock:
+            # Serialize and clear the flag together, so a change made while
+            # the file is being written marks the config dirty again
+            text = io.StringIO()
+            self.config.write(text)
+            self._dirty = False
         try:
-            with open(self.config_path, 'w') as configfile:
-                self.config.write(configfile)
+            # Write to a temp file and swap it in so a crash mid-write
+            # can't leave a truncated config.ini behind
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.config_dir, prefix='.config-', suffix='.tmp',
+                delete=False
+            ) as configfile:
+                configfile.write(text.getvalue())
+            os.replace(configfile.name, self.config_path)
+            self._mtime = os.stat(self.config_path).st_mtime
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
+            self._dirty = True
+            try:
+                os.remove(configfile.name)
+            except (NameError, OSError):
+                pass
             return False
 
+    def flush(self) -> bool:
+        """
+        Save configuration if anything changed since the last save.
+
+        Returns:
+            True if nothing needed saving or the save succeeded
+        """
+        if not self._dirty:
+            return True
+        return self.save_config()
+
     def get_app_path(self, app_key: str) -> Optional[str]:
         """
         Get the saved path for an application.
@@ -85,23 +183,141 @@ class ConfigManager:
         """
         if app_key in self.config[self.SECTION_NAME]:
             saved_path = self.config[self.SECTION_NAME][app_key]
-            if os.path.exists(saved_path):
+            if self._path_exists(saved_path):
                 return saved_path
         return None
 
+    def _path_exists(self, path: str) -> bool:
+        """
+        Check whether a path exists, reusing recent results.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path existed within the last EXISTS_TTL seconds
+        """
+        now = time.monotonic()
+        checked_at, exists = self._exists_cache.get(path, (float("-inf"), False))
+        if now - checked_at >= self.EXISTS_TTL:
+            exists = os.path.exists(path)
+            self._exists_cache[path] = (now, exists)
+        return exists
+
     def set_app_path(self, app_key: str, path: str) -> bool:
         """
         Save an application path to config.
 
+        The file is written on the next save_config()/flush() or at exit.
+
         Args:
             app_key: Config key for the application
             path: Full path to the executable
 
         Returns:
-            True if saved successfully, False otherwise
+            True once the path is recorded
         """
-        self.config[self.SECTION_NAME][app_key] = path
-        return self.save_config()
+        with self._lock:
+            self.config[self.SECTION_NAME][app_key] = path
+            self._exists_cache.pop(path, None)
+            self._dirty = True
+        return True
+
+    def set_setting(self, key: str, value: str) -> bool:
+        """
+        Set a value in the Settings section if it differs from the stored one.
+
+        The file is written on the next save_config()/flush() or at exit.
+
+        Args:
+            key: Setting name
+            value: String value
+
+        Returns:
+            True if the stored value changed
+        """
+        with self._lock:
+            if self.config.get(self.SETTINGS_SECTION, key) == value:
+                return False
+            self.config.set(self.SETTINGS_SECTION, key, value)
+            self._dirty = True
+            return True
+
+    def get_last_browse_dir(self, app_key: str, fallback: str) -> str:
+        """
+        Get the folder a Browse dialog for this app last picked from.
+
+        Args:
+            app_key: Config key for the application or game
+            fallback: Folder to use if nothing was picked yet
+
+        Returns:
+            Folder path
+        """
+        return self.config.get(self.LAST_BROWSE_SECTION, app_key, fallback=fallback)
+
+    def set_last_browse_dir(self, app_key: str, folder: str) -> bool:
+        """
+        Remember the folder a Browse dialog for this app picked from.
+
+        The file is written on the next save_config()/flush() or at exit.
+
+        Args:
+            app_key: Config key for the application or game
+            folder: Folder containing the selected file
+
+        Returns:
+            True if the stored folder changed
+        """
+        with self._lock:
+            if self.config.get(self.LAST_BROWSE_SECTION, app_key) == folder:
+                return False
+            self.config.set(self.LAST_BROWSE_SECTION, app_key, folder)
+            self._dirty = True
+            return True
+
+    def get_shortcut_targets(self) -> Dict[str, Tuple[float, int, str]]:
+        """
+        Get the cached .lnk resolutions saved in config.
+
+        Returns:
+            Mapping of .lnk path to (mtime, size, target path)
+        """
+        targets = {}
+        with self._lock:
+            entries = self.config.items(self.SHORTCUT_CACHE_SECTION, raw=True)
+        for _, entry in entries:
+            # "mtime|size|shortcut|target" - '|' can't appear in Windows paths
+            parts = entry.split("|")
+            if len(parts) != 4:
+                continue
+            try:
+                targets[parts[2]] = (float(parts[0]), int(parts[1]), parts[3])
+            except ValueError:
+                continue
+        return targets
+
+    def set_shortcut_targets(self, targets: Dict[str, Tuple[float, int, str]]) -> bool:
+        """
+        Record .lnk resolutions in config, marking it dirty only if they changed.
+
+        Args:
+            targets: Mapping of .lnk path to (mtime, size, target path)
+
+        Returns:
+            True once the targets are recorded
+        """
+        # Paths are stored in values; option names are lowercased on save
+        entries = {
+            f"lnk{i}": f"{mtime!r}|{size}|{shortcut}|{target}"
+            for i, (shortcut, (mtime, size, target)) in enumerate(sorted(targets.items()))
+        }
+        with self._lock:
+            if entries == dict(self.config.items(self.SHORTCUT_CACHE_SECTION, raw=True)):
+                return True
+            self.config[self.SHORTCUT_CACHE_SECTION] = entries
+            self._dirty = True
+        return True
 
     @staticmethod
     def get_config_key(app_name: str) -> str:
@@ -114,4 +330,16 @@ class ConfigManager:
         Returns:
             Config key string
         """
-        return app_name.lower().replace(" ", "_")
+        # Known apps and games are precomputed; derive anything else
+        return CONFIG_KEYS.get(app_name) or app_name.lower().replace(" ", "_")
+
+
+@functools.lru_cache(maxsize=None)
+def get_config_manager() -> ConfigManager:
+    """
+    Get the shared ConfigManager, creating it on first use.
+
+    Returns:
+        The process-wide ConfigManager instance
+    """
+    return ConfigManager()
@@ -0,0 +1,169 @@
+"""
+Minimal INI file storage for config.ini.
+
+config.ini only ever holds a few sections of ``key = value`` lines, so this
+reads it straight into dicts instead of going through configparser. The
+subset of the configparser API that the app uses is kept, so callers don't
+need to know the difference.
+"""
+
+from typing import Dict, IO, List, Optional, Tuple
+
+
+_BOOLEAN_STATES = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+}
+
+
+class IniConfig:
+    """Sections of string key/value pairs, read from and written to INI text."""
+
+    def __init__(self):
+        """Initialize an empty config."""
+        self._sections: Dict[str, Dict[str, str]] = {}
+
+    @staticmethod
+    def optionxform(option: str) -> str:
+        """Normalize an option name the way configparser does (lowercase)."""
+        return option.lower()
+
+    def read(self, path: str):
+        """
+        Load sections from an INI file, merging into the current ones.
+
+        Args:
+            path: Path to the INI file
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except UnicodeDecodeError:
+            # Files written by configparser used the locale encoding
+            with open(path, "r") as f:
+                text = f.read()
+
+        section = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line[0] == "[" and line[-1] == "]":
+                section = self._sections.setdefault(line[1:-1].strip(), {})
+                continue
+            if section is None:
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                section[self.optionxform(key.strip())] = value.strip()
+
+    def write(self, f: IO[str]):
+        """
+        Write all sections as INI text.
+
+        Args:
+            f: Text file opened for writing
+        """
+        for name, options in self._sections.items():
+            f.write(f"[{name}]\n")
+            for key, value in options.items():
+                f.write(f"{key} = {value}\n")
+            f.write("\n")
+
+    def __contains__(self, section: str) -> bool:
+        return section in self._sections
+
+    def __getitem__(self, section: str) -> Dict[str, str]:
+        return self._sections[section]
+
+    def __setitem__(self, section: str, options: Dict[str, str]):
+        self._sections[section] = {
+            self.optionxform(key): str(value) for key, value in options.items()
+        }
+
+    def get(self, section: str, option: str, fallback: Optional[str] = None) -> Optional[str]:
+        """
+        Get an option value.
+
+        Args:
+            section: Section name
+            option: Option name
+            fallback: Returned if the section or option is missing
+
+        Returns:
+            The stored string, or fallback
+        """
+        return self._sections.get(section, {}).get(self.optionxform(option), fallback)
+
+    def getboolean(self, section: str, option: str, fallback: Optional[bool] = None) -> Optional[bool]:
+        """
+        Get an option value as a boolean.
+
+        Args:
+            section: Section name
+            option: Option name
+            fallback: Returned if the section or option is missing
+
+        Returns:
+            The parsed boolean, or fallback
+
+        Raises:
+            ValueError: If the stored value is not a recognized boolean
+        """
+        value = self.get(section, option)
+        if value is None:
+            return fallback
+        try:
+            return _BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {value}")
+
+    def set(self, section: str, option: str, value: str):
+        """
+        Set an option value.
+
+        Args:
+            section: Section name (must already exist)
+            option: Option name
+            value: String value
+        """
+        self._sections[section][self.optionxform(option)] = value
+
+    def remove_option(self, section: str, option: str) -> bool:
+        """
+        Remove an option if present.
+
+        Args:
+            section: Section name
+            option: Option name
+
+        Returns:
+            True if the option existed
+        """
+        return self._sections[section].pop(self.optionxform(option), None) is not None
+
+    def remove_section(self, section: str) -> bool:
+        """
+        Remove a section if present.
+
+        Args:
+            section: Section name
+
+        Returns:
+            True if the section existed
+        """
+        return self._sections.pop(section, None) is not None
+
+    def items(self, section: str, raw: bool = False) -> List[Tuple[str, str]]:
+        """
+        Get the (option, value) pairs of a section.
+
+        Args:
+            section: Section name
+            raw: Accepted for configparser compatibility; values are never
+                interpolated
+
+        Returns:
+            List of (option, value) pairs
+        """
+        return list(self._sections[section].items())
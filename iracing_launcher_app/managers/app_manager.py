@@ -4,16 +4,35 @@ Companion application management.
 Handles path detection, launching, and closing of companion applications.
 """
 
+import logging
 import os
-from typing import Dict, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, List, Set, Tuple
 
-from ..core.app_definitions import APPS
+from ..core.app_definitions import APPS, AppSpec
 from ..core.config_manager import ConfigManager
-from ..utils.path_finder import find_shortcut_target, find_path_in_list
+from ..utils.path_finder import (
+    find_shortcut_target,
+    get_shortcut_targets,
+    load_shortcut_targets,
+)
 from .process_manager import ProcessManager
 from .process_tracker import ProcessTracker
 
 
+logger = logging.getLogger(__name__)
+
+# How often (ms) the Tk thread checks for a finished status snapshot
+STATUS_POLL_MS = 25
+
+# Folders that dynamic_paths in app_definitions.py may be relative to,
+# resolved once at import
+_ENV_DIRS = {
+    env: os.environ.get(env, '')
+    for env in ('APPDATA', 'LOCALAPPDATA', 'ProgramData', 'ProgramFiles')
+}
+
+
 class AppManager:
     """Manages companion application operations."""
 
@@ -30,37 +49,47 @@ class AppManager:
             process_tracker: Tracker for PID-based launch/close
         """
         self.config_manager = config_manager
+        load_shortcut_targets(config_manager.get_shortcut_targets())
         self.apps = self._initialize_apps()
         self.process_manager = ProcessManager()
         self.process_tracker = process_tracker
+        # Apps whose Start Menu search came up empty this session; not
+        # persisted, so a later install is picked up on the next run
+        self._not_found: Set[str] = set()
+        # Launches and closes wait on processes; run them here so the Tk
+        # event loop keeps running in the meantime. One worker per app lets
+        # a whole launch or close sequence proceed in parallel.
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.apps), thread_name_prefix="app-launch"
+        )
 
-    def _initialize_apps(self) -> Dict:
+    def _initialize_apps(self) -> Dict[str, AppSpec]:
         """
         Initialize app definitions with dynamic paths.
 
         Returns:
-            Dictionary of app definitions
+            Dictionary of app name to resolved AppSpec
         """
-        apps = APPS.copy()
-
-        # Add dynamic path for Garage61
-        if "Garage61" in apps:
-            appdata_path = os.path.join(
-                os.getenv('APPDATA'),
-                r"garage61-install\garage61-launcher.exe"
+        apps = {}
+        for name, info in APPS.items():
+            # Prepend per-user install locations declared as dynamic_paths
+            dynamic_paths = [
+                os.path.join(_ENV_DIRS[env], subpath)
+                for env, subpath in info.get("dynamic_paths", ())
+                if _ENV_DIRS.get(env)
+            ]
+            paths = (*dynamic_paths, *info.get("paths", ()))
+
+            apps[name] = AppSpec(
+                name=name,
+                exe=info["exe"],
+                exe_lower=info["exe"].lower(),
+                config_key=ConfigManager.get_config_key(name),
+                shortcut_names=tuple(info.get("shortcut_names", ())),
+                paths=paths,
+                # Checked once up front rather than on every find_app_path
+                existing_paths=tuple(path for path in paths if os.path.exists(path)),
             )
-            apps["Garage61"]["paths"] = [appdata_path]
-
-        # Elgato Stream Deck uses static paths from app_definitions.py
-        # No dynamic path needed
-
-        # Add dynamic path for TrackTitan
-        if "TrackTitan" in apps:
-            localappdata_path = os.path.join(
-                os.getenv('LOCALAPPDATA'),
-                r"Programs\track-titan-ghost-application\TrackTitanDesktopApplication.exe"
-            )
-            apps["TrackTitan"]["paths"] = [localappdata_path]
 
         return apps
 
@@ -84,7 +113,21 @@ class AppManager:
             Executable name if found, None otherwise
         """
         if app_name in self.apps:
-            return self.apps[app_name]["exe"]
+            return self.apps[app_name].exe
+        return None
+
+    def get_app_config_key(self, app_name: str) -> Optional[str]:
+        """
+        Get the config.ini key under which an application's path is saved.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Config key if the app is known, None otherwise
+        """
+        if app_name in self.apps:
+            return self.apps[app_name].config_key
         return None
 
     def find_app_path(self, app_name: str) -> Optional[str]:
@@ -93,7 +136,7 @@ class AppManager:
 
         Checks in order:
         1. Saved path in config.ini
-        2. Start Menu shortcuts
+        2. Start Menu shortcuts (skipped after a failed search this session)
         3. Hardcoded common paths
 
         Args:
@@ -105,33 +148,149 @@ class AppManager:
         if app_name not in self.apps:
             return None
 
-        app_info = self.apps[app_name]
-        config_key = ConfigManager.get_config_key(app_name)
+        spec = self.apps[app_name]
+        config_key = spec.config_key
 
         # First check config.ini for saved path
         saved_path = self.config_manager.get_app_path(config_key)
         if saved_path:
             return saved_path
 
-        # Try to find via Start Menu shortcut
-        shortcut_path = find_shortcut_target(
-            app_info.get("shortcut_names", []),
-            is_game=False
-        )
-        if shortcut_path:
-            # Save to config for next time
-            self.config_manager.set_app_path(config_key, shortcut_path)
-            return shortcut_path
+        # Skip the Start Menu search if it already came up empty
+        if app_name not in self._not_found:
+            shortcut_path = find_shortcut_target(
+                spec.shortcut_names,
+                is_game=False
+            )
+            # Keep resolved .lnk targets so later runs skip the COM reads
+            self.config_manager.set_shortcut_targets(get_shortcut_targets())
+            if shortcut_path:
+                # Save to config for next time
+                self.config_manager.set_app_path(config_key, shortcut_path)
+                return shortcut_path
 
         # Fall back to hardcoded paths
-        found_path = find_path_in_list(app_info.get("paths", []))
-        if found_path:
+        if spec.existing_paths:
+            found_path = spec.existing_paths[0]
             # Save to config for next time
             self.config_manager.set_app_path(config_key, found_path)
             return found_path
 
+        self._not_found.add(app_name)
         return None
 
+    def check_apps(
+        self, app_names: Iterable[str]
+    ) -> List[Tuple[str, Optional[str], bool, List[str]]]:
+        """
+        Find the path and running state of each app.
+
+        Args:
+            app_names: Names of the applications to check
+
+        Returns:
+            List of (app name, path or None, running, helper exe names)
+        """
+        results = []
+        for app_name in app_names:
+            app_path = self.find_app_path(app_name)
+            running = bool(app_path) and self.is_app_running(app_name)
+            child_names = self.get_child_names(app_name) if running else []
+            results.append((app_name, app_path, running, child_names))
+        return results
+
+    def check_apps_async(self, app_names: Iterable[str]) -> Future:
+        """
+        Run check_apps on a worker thread.
+
+        The apps are checked one after another in a single task, since
+        path lookups share the config and shortcut caches.
+
+        Args:
+            app_names: Names of the applications to check
+
+        Returns:
+            Future resolving to the result of check_apps
+        """
+        return self._executor.submit(self.check_apps, tuple(app_names))
+
+    def get_running_apps(self) -> Tuple[Dict[str, int], FrozenSet[str]]:
+        """
+        Get which apps are running, from one snapshot plus tracked PIDs.
+
+        Apps the launcher started count as running while their tracked
+        process is alive, even if its exe name differs from the app's.
+        The snapshot is returned too, so callers can check games against
+        it without walking the process table again.
+
+        Returns:
+            (mapping of running app name to helper process count,
+            lowercased exe names in the snapshot)
+        """
+        running_names = self.process_manager.get_running_names()
+        running = {}
+        for app_name, spec in self.apps.items():
+            if spec.exe_lower in running_names or self.process_tracker.is_alive(app_name):
+                running[app_name] = self.process_tracker.get_child_count(app_name)
+        return running, running_names
+
+    def schedule_status_refresh(
+        self,
+        root,
+        callback: Callable[[Dict[str, int], FrozenSet[str]], None],
+        interval_ms: int = 2000,
+    ):
+        """
+        Report which apps are running, now and every interval_ms.
+
+        Each tick runs get_running_apps on a worker thread and passes its
+        two results to callback. Results are picked up
+        with root.after, so callback always runs on the Tk thread.
+
+        Args:
+            root: Tk root window used for scheduling
+            callback: Called with the running apps' helper counts and the
+                snapshot of running exe names
+            interval_ms: Delay between refreshes in milliseconds
+        """
+        future = self._executor.submit(self.get_running_apps)
+        self._poll_status_refresh(root, future, callback, interval_ms)
+
+    def _poll_status_refresh(
+        self,
+        root,
+        future: Future,
+        callback: Callable[[Dict[str, int], FrozenSet[str]], None],
+        interval_ms: int,
+    ):
+        """
+        Deliver a status snapshot once ready, then schedule the next tick.
+
+        Args:
+            root: Tk root window used for scheduling
+            future: Future resolving to the result of get_running_apps
+            callback: Called with the running apps' helper counts and the
+                snapshot of running exe names
+            interval_ms: Delay between refreshes in milliseconds
+        """
+        if not future.done():
+            root.after(
+                STATUS_POLL_MS,
+                self._poll_status_refresh, root, future, callback, interval_ms
+            )
+            return
+
+        try:
+            running_apps, running_names = future.result()
+        except Exception as e:
+            logger.warning("Status refresh failed: %s", e, exc_info=True)
+        else:
+            callback(running_apps, running_names)
+        root.after(
+            interval_ms,
+            self.schedule_status_refresh, root, callback, interval_ms
+        )
+
     def is_app_running(self, app_name: str) -> bool:
         """Whether the app is currently running.
 
@@ -148,8 +307,7 @@ class AppManager:
             # Fall through: tracked entry was dropped, but the user may
             # have a separate instance running.
 
-        exe_name = self.apps[app_name]["exe"]
-        return self.process_manager.is_process_running(exe_name)
+        return self.apps[app_name].exe_lower in self.process_manager.get_running_names()
 
     def get_child_count(self, app_name: str) -> int:
         """Descendant-process count for a tracked app, else 0."""
@@ -163,24 +321,74 @@ class AppManager:
             return []
         return self.process_tracker.get_child_names(app_name)
 
-    def launch_app(self, app_name: str, app_path: str) -> bool:
-        """Launch an app, track its PID, and report whether it's alive."""
+    def launch_app(
+        self, app_name: str, app_path: str
+    ) -> Tuple[bool, bool, List[str]]:
+        """
+        Launch an app unless it is already running, and track its PID.
+
+        The running check and the helper lookup walk the process table, so
+        they are done here, on the worker, along with the launch itself.
+
+        Args:
+            app_name: Name of the application
+            app_path: Full path to the executable
+
+        Returns:
+            (already running, running now, helper exe names)
+        """
         if app_name not in self.apps:
-            return False
-        return self.process_tracker.launch_and_track(app_name, app_path)
+            return False, False, []
+        if self.is_app_running(app_name):
+            return True, True, self.get_child_names(app_name)
 
-    def close_app(self, app_name: str) -> bool:
+        started = self.process_tracker.launch_and_track(
+            app_name, app_path, process_name=self.apps[app_name].exe
+        )
+        return False, started, self.get_child_names(app_name) if started else []
+
+    def launch_app_async(self, app_name: str, app_path: str) -> Future:
+        """
+        Launch an app on a worker thread.
+
+        Args:
+            app_name: Name of the application
+            app_path: Full path to the executable
+
+        Returns:
+            Future resolving to the result of launch_app
+        """
+        return self._executor.submit(self.launch_app, app_name, app_path)
+
+    def close_app(self, app_name: str) -> Tuple[bool, List[str]]:
         """Close a tracked app and its process tree.
 
         If we don't have a tracked PID (e.g. user launched it manually),
         fall back to killing by exe name so the close button still works.
+
+        Returns:
+            (closed, helper exe names found before closing)
         """
         if app_name not in self.apps:
-            return False
+            return False, []
 
+        # Looked up first; the helpers are gone once the tree is closed
+        child_names = self.get_child_names(app_name)
         if self.process_tracker.is_tracked(app_name):
             if self.process_tracker.close_tracked(app_name):
-                return True
+                return True, child_names
+
+        closed = self.process_manager.kill_process(self.apps[app_name].exe_lower)
+        return closed, child_names
+
+    def close_app_async(self, app_name: str) -> Future:
+        """
+        Close an app on a worker thread.
 
-        exe_name = self.apps[app_name]["exe"]
-        return self.process_manager.kill_process(exe_name)
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Future resolving to the result of close_app
+        """
+        return self._executor.submit(self.close_app, app_name)
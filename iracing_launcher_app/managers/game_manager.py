@@ -4,9 +4,10 @@ Racing game management.
 Handles path detection, launching, and status checking for racing simulators.
 """
 
+import logging
 import os
-import time
-from typing import Dict, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Optional, List, Set, Tuple
 
 from ..core.app_definitions import RACE_GAMES
 from ..core.config_manager import ConfigManager
@@ -15,6 +16,9 @@ from ..utils.steam_registry import check_steam_game_installed
 from .process_manager import ProcessManager
 
 
+logger = logging.getLogger(__name__)
+
+
 class GameManager:
     """Manages racing game operations."""
 
@@ -26,8 +30,19 @@ class GameManager:
             config_manager: ConfigManager instance for path persistence
         """
         self.config_manager = config_manager
-        self.games = RACE_GAMES.copy()
+        # Per-instance copies, each with its config key derived once
+        self.games = {
+            name: {**info, "config_key": f"game_{ConfigManager.get_config_key(name)}"}
+            for name, info in RACE_GAMES.items()
+        }
         self.process_manager = ProcessManager()
+        # Exe names never change, so lowercase them once for process matching
+        self._game_exe_lower = {
+            name: info["exe"].lower() for name, info in self.games.items()
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="game-launch"
+        )
 
     def get_game_list(self) -> List[str]:
         """
@@ -52,6 +67,20 @@ class GameManager:
             return self.games[game_name]["exe"]
         return None
 
+    def get_game_config_key(self, game_name: str) -> Optional[str]:
+        """
+        Get the config.ini key under which a game's path is saved.
+
+        Args:
+            game_name: Name of the game
+
+        Returns:
+            Config key if the game is known, None otherwise
+        """
+        if game_name in self.games:
+            return self.games[game_name]["config_key"]
+        return None
+
     def find_game_path(self, game_name: str) -> Optional[str]:
         """
         Find the installation path for a game.
@@ -67,34 +96,34 @@ class GameManager:
             steam:// protocol URL if found via registry, saved path from config, or None
         """
         if game_name not in self.games:
-            print(f"[Game Search] {game_name} not in games list")
+            logger.debug("Game search: %s not in games list", game_name)
             return None
 
         game_info = self.games[game_name]
-        config_key = f"game_{ConfigManager.get_config_key(game_name)}"
+        config_key = game_info["config_key"]
 
-        print(f"[Game Search] Searching for {game_name}...")
+        logger.debug("Game search: searching for %s", game_name)
 
         # First check config.ini for saved path (manual browse)
         saved_path = self.config_manager.get_app_path(config_key)
         if saved_path:
-            print(f"[Game Search] Found in config: {saved_path}")
+            logger.debug("Game search: found in config: %s", saved_path)
             return saved_path
 
         # Check Steam registry
         steam_appid = game_info.get("steam_appid")
         if steam_appid:
-            print(f"[Game Search] Checking registry for Steam App {steam_appid}...")
+            logger.debug("Game search: checking registry for Steam App %s", steam_appid)
             if check_steam_game_installed(steam_appid):
                 steam_url = f"steam://rungameid/{steam_appid}"
-                print(f"[Game Search] Will use Steam protocol: {steam_url}")
+                logger.debug("Game search: will use Steam protocol: %s", steam_url)
                 # Save to config for next time
                 self.config_manager.set_app_path(config_key, steam_url)
                 return steam_url
         else:
-            print(f"[Game Search] No Steam app ID configured for {game_name}")
+            logger.debug("Game search: no Steam app ID configured for %s", game_name)
 
-        print(f"[Game Search] {game_name} not found - use Browse to manually select")
+        logger.debug("Game search: %s not found - use Browse to manually select", game_name)
         return None
 
     def is_game_running(self, game_name: str) -> bool:
@@ -110,10 +139,87 @@ class GameManager:
         if game_name not in self.games:
             return False
 
-        exe_name = self.games[game_name]["exe"]
-        return self.process_manager.is_process_running(exe_name)
+        return self._game_exe_lower[game_name] in self.process_manager.get_running_names()
+
+    def get_running_games(
+        self, running_names: Optional[FrozenSet[str]] = None
+    ) -> Set[str]:
+        """
+        Get which games are running, from one process snapshot.
+
+        Args:
+            running_names: Snapshot of lowercased exe names to check against
+                (takes one if not given)
+
+        Returns:
+            Set of names of the games currently running
+        """
+        running = running_names
+        if running is None:
+            running = self.process_manager.get_running_names()
+        return {
+            name for name, exe in self._game_exe_lower.items() if exe in running
+        }
+
+    def check_games(
+        self, game_names: Iterable[str]
+    ) -> List[Tuple[str, Optional[str], bool]]:
+        """
+        Find the path and running state of each game.
+
+        Args:
+            game_names: Names of the games to check
+
+        Returns:
+            List of (game name, path or None, running)
+        """
+        results = []
+        for game_name in game_names:
+            game_path = self.find_game_path(game_name)
+            running = bool(game_path) and self.is_game_running(game_name)
+            results.append((game_name, game_path, running))
+        return results
+
+    def check_games_async(self, game_names: Iterable[str]) -> Future:
+        """
+        Run check_games on a worker thread.
+
+        Args:
+            game_names: Names of the games to check
+
+        Returns:
+            Future resolving to the result of check_games
+        """
+        return self._executor.submit(self.check_games, tuple(game_names))
+
+    def is_game_running_async(self, game_name: str) -> Future:
+        """
+        Run is_game_running on a worker thread.
 
-    def launch_game(self, game_name: str, game_path: str) -> bool:
+        Args:
+            game_name: Name of the game
+
+        Returns:
+            Future resolving to the result of is_game_running
+        """
+        return self._executor.submit(self.is_game_running, game_name)
+
+    def launch_game(self, game_name: str, game_path: str) -> Tuple[bool, bool]:
+        """
+        Launch a game unless it is already running.
+
+        Args:
+            game_name: Name of the game
+            game_path: Full path to .lnk/.exe or steam:// protocol URL
+
+        Returns:
+            (already running, running now)
+        """
+        if self.is_game_running(game_name):
+            return True, True
+        return False, self._start_game(game_name, game_path)
+
+    def _start_game(self, game_name: str, game_path: str) -> bool:
         """
         Launch a game via Steam protocol, .lnk shortcut, or .exe file.
 
@@ -127,34 +233,55 @@ class GameManager:
         if game_name not in self.games:
             return False
 
+        exe_lower = self._game_exe_lower[game_name]
         try:
             # Check if it's a Steam protocol URL
             if game_path.startswith("steam://"):
-                print(f"[Launch] Launching via Steam protocol: {game_path}")
+                logger.debug("Launch: via Steam protocol: %s", game_path)
                 os.startfile(game_path)
-                time.sleep(3)  # Give Steam more time to start the game
+                # Give Steam more time to start the game
+                is_running = self.process_manager.wait_for_process(exe_lower, 3)
             # Check if it's a .lnk file
             elif game_path.lower().endswith('.lnk'):
-                print(f"[Launch] Launching via shortcut: {game_path}")
+                logger.debug("Launch: via shortcut: %s", game_path)
                 os.startfile(game_path)
-                time.sleep(2)
+                is_running = self.process_manager.wait_for_process(exe_lower, 2)
             else:
                 # Launch .exe directly
-                print(f"[Launch] Launching executable: {game_path}")
-                if not self.process_manager.launch_process(game_path):
+                logger.debug("Launch: executable: %s", game_path)
+                proc = self.process_manager.launch_process(game_path)
+                if proc is None:
                     return False
-
-            # Check if process is running
-            exe_name = self.games[game_name]["exe"]
-            is_running = self.process_manager.is_process_running(exe_name)
-            print(f"[Launch] Process check for {exe_name}: {'Running' if is_running else 'Not running'}")
+                # Still alive means it's up; an exe that exited may have
+                # handed off to the game's own process, so wait for that
+                is_running = (
+                    proc.poll() is None
+                    or self.process_manager.wait_for_process(exe_lower, 2)
+                )
+
+            logger.debug(
+                "Launch: process check for %s: %s",
+                self.games[game_name]["exe"],
+                "running" if is_running else "not running",
+            )
             return is_running
         except Exception as e:
-            print(f"[Launch] Error launching {game_name}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Launch: error launching %s: %s", game_name, e)
             return False
 
+    def launch_game_async(self, game_name: str, game_path: str) -> Future:
+        """
+        Launch a game on a worker thread.
+
+        Args:
+            game_name: Name of the game
+            game_path: Full path to .lnk/.exe or steam:// protocol URL
+
+        Returns:
+            Future resolving to the result of launch_game
+        """
+        return self._executor.submit(self.launch_game, game_name, game_path)
+
     def close_game(self, game_name: str) -> bool:
         """
         Close a game by killing its process.
@@ -168,5 +295,4 @@ class GameManager:
         if game_name not in self.games:
             return False
 
-        exe_name = self.games[game_name]["exe"]
-        return self.process_manager.kill_process(exe_name)
+        return self.process_manager.kill_process(self._game_exe_lower[game_name])
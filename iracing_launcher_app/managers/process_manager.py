@@ -7,12 +7,84 @@ Provides shared functionality for checking, launching, and killing processes.
 import subprocess
 import time
 import psutil
-from typing import List
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..utils.win_processes import (
+    iter_processes,
+    terminate_processes,
+    wait_for_input_idle,
+)
 
 
 class ProcessManager:
     """Manages process operations (checking, launching, killing)."""
 
+    # How long (seconds) a process-table snapshot is reused. Status checks
+    # for every app and game within one refresh share a single walk.
+    SNAPSHOT_TTL = 0.5
+
+    # How long (seconds) to wait for killed processes to exit
+    KILL_WAIT_TIMEOUT = 1.0
+
+    # First and longest interval (seconds) between checks while waiting
+    # for a launched process to appear
+    APPEAR_POLL_START = 0.05
+    APPEAR_POLL_MAX = 0.4
+
+    _snapshot: Tuple[float, FrozenSet[str]] = (float("-inf"), frozenset())
+
+    @staticmethod
+    def _iter_proc_names_and_pids() -> Iterator[Tuple[int, str]]:
+        """
+        Walk the process table once.
+
+        On Windows a single Toolhelp32 snapshot is used. Elsewhere, or if
+        the snapshot fails, psutil is asked for just ``pid`` and ``name``.
+
+        Yields:
+            (pid, lowercased executable name) for every process with a name
+        """
+        try:
+            # Materialize so a failed snapshot falls back before yielding
+            processes = list(iter_processes())
+        except OSError:
+            processes = None
+        if processes is not None:
+            yield from processes
+            return
+
+        for proc in psutil.process_iter(['pid', 'name']):
+            name = proc.info['name']
+            if name:
+                yield proc.info['pid'], name.lower()
+
+    @classmethod
+    def get_running_names(cls) -> FrozenSet[str]:
+        """
+        Get the lowercased executable names of all running processes.
+
+        The result is cached for ``SNAPSHOT_TTL`` seconds so that checking
+        many apps in a row costs one ``process_iter`` walk, not one per app.
+
+        Returns:
+            Frozen set of lowercased process names
+        """
+        taken_at, names = cls._snapshot
+        now = time.monotonic()
+        if now - taken_at < cls.SNAPSHOT_TTL:
+            return names
+
+        names = frozenset(
+            name for _, name in ProcessManager._iter_proc_names_and_pids()
+        )
+        cls._snapshot = (now, names)
+        return names
+
+    @classmethod
+    def invalidate_snapshot(cls):
+        """Drop the cached snapshot so the next check walks processes again."""
+        cls._snapshot = (float("-inf"), frozenset())
+
     @staticmethod
     def is_process_running(process_name: str) -> bool:
         """
@@ -24,32 +96,79 @@ class ProcessManager:
         Returns:
             True if process is running, False otherwise
         """
-        for proc in psutil.process_iter(['name']):
-            try:
-                if proc.info['name'].lower() == process_name.lower():
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        return False
+        return process_name.lower() in ProcessManager.get_running_names()
+
+    @staticmethod
+    def wait_until_ready(proc: subprocess.Popen, wait_time: float) -> None:
+        """
+        Wait for a just-launched process to finish starting up.
+
+        On Windows this returns once the process's message loop is idle.
+        Otherwise, or for processes without a message loop, it waits up to
+        ``wait_time`` and returns early only if the process exits.
+
+        Args:
+            proc: The launched process
+            wait_time: Longest time to wait (seconds)
+        """
+        try:
+            if wait_for_input_idle(proc.pid, int(wait_time * 1000)):
+                return
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=wait_time)
+        except subprocess.TimeoutExpired:
+            pass
+
+    @classmethod
+    def wait_for_process(cls, process_name: str, timeout: float) -> bool:
+        """
+        Wait for a process to show up, checking with a growing interval.
+
+        Used for launches that hand off to another program (Steam, shell
+        shortcuts), where there is no process handle to wait on.
+
+        Args:
+            process_name: Name of the process executable
+            timeout: Longest time to wait (seconds)
+
+        Returns:
+            True if the process appeared within ``timeout``
+        """
+        process_name = process_name.lower()
+        deadline = time.monotonic() + timeout
+        interval = cls.APPEAR_POLL_START
+        while True:
+            cls.invalidate_snapshot()
+            if process_name in cls.get_running_names():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, cls.APPEAR_POLL_MAX)
 
     @staticmethod
-    def launch_process(exe_path: str, wait_time: float = 2.0) -> bool:
+    def launch_process(
+        exe_path: str, wait_time: float = 2.0
+    ) -> Optional[subprocess.Popen]:
         """
-        Launch a process and verify it started.
+        Launch a process and wait for it to start.
 
         Args:
             exe_path: Full path to the executable
-            wait_time: Time to wait before checking if process started (seconds)
+            wait_time: Longest time to wait for the process to start (seconds)
 
         Returns:
-            True if launched successfully, False otherwise
+            The launched process, or None if it could not be started
         """
         try:
             # Launch the app completely detached from this process
             # DETACHED_PROCESS: Prevents inheriting console
             # CREATE_NEW_PROCESS_GROUP: Creates independent process group
             # This ensures the launched app doesn't hold handles to our temp directory
-            subprocess.Popen(
+            proc = subprocess.Popen(
                 [exe_path],
                 shell=False,
                 close_fds=True,
@@ -58,11 +177,73 @@ class ProcessManager:
                 stderr=subprocess.DEVNULL,
                 creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
             )
-            time.sleep(wait_time)
-            return True
+            ProcessManager.wait_until_ready(proc, wait_time)
+            ProcessManager.invalidate_snapshot()
+            return proc
         except Exception as e:
             print(f"Error launching {exe_path}: {e}")
-            return False
+            return None
+
+    @staticmethod
+    def _kill_pids(pids: Iterable[int]) -> Set[int]:
+        """
+        Kill the given processes.
+
+        Args:
+            pids: Process IDs to kill
+
+        Returns:
+            The PIDs that were killed
+        """
+        pids = list(pids)
+        try:
+            # One OpenProcess/TerminateProcess per PID, no psutil lookups
+            killed_pids = terminate_processes(
+                pids, ProcessManager.KILL_WAIT_TIMEOUT
+            )
+        except OSError:
+            pass  # Not on Windows; fall back to psutil below
+        else:
+            if killed_pids:
+                ProcessManager.invalidate_snapshot()
+            return killed_pids
+
+        # Send every kill first, then reap them together, so teardowns
+        # overlap instead of running one after another.
+        killed = []
+        for pid in pids:
+            try:
+                proc = psutil.Process(pid)
+                proc.kill()
+                killed.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        if not killed:
+            return set()
+
+        psutil.wait_procs(killed, timeout=ProcessManager.KILL_WAIT_TIMEOUT)
+        ProcessManager.invalidate_snapshot()
+        return {proc.pid for proc in killed}
+
+    @staticmethod
+    def kill_processes_by_name(process_names: Iterable[str]) -> Dict[str, int]:
+        """
+        Kill every process matching any of the names, in one process walk.
+
+        Args:
+            process_names: Process executable names
+
+        Returns:
+            Mapping of lowercased name to the number of processes killed
+        """
+        counts = {name.lower(): 0 for name in process_names}
+        matches = {
+            pid: name for pid, name in ProcessManager._iter_proc_names_and_pids()
+            if name in counts
+        }
+        for pid in ProcessManager._kill_pids(matches):
+            counts[matches[pid]] += 1
+        return counts
 
     @staticmethod
     def kill_process(process_name: str) -> bool:
@@ -75,15 +256,7 @@ class ProcessManager:
         Returns:
             True if process was killed, False if not running
         """
-        killed = False
-        for proc in psutil.process_iter(['name']):
-            try:
-                if proc.info['name'].lower() == process_name.lower():
-                    proc.kill()
-                    killed = True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        return killed
+        return ProcessManager.kill_all_processes([process_name])
 
     @staticmethod
     def kill_all_processes(process_names: List[str]) -> bool:
@@ -96,8 +269,4 @@ class ProcessManager:
         Returns:
             True if any processes were killed, False otherwise
         """
-        any_killed = False
-        for process_name in process_names:
-            if ProcessManager.kill_process(process_name):
-                any_killed = True
-        return any_killed
+        return any(ProcessManager.kill_processes_by_name(process_names).values())
@@ -13,11 +13,13 @@ reuse after a restart.
 import json
 import os
 import subprocess
-import time
+import threading
 from typing import Dict, Optional, Tuple
 
 import psutil
 
+from .process_manager import ProcessManager
+
 
 # Tolerance (seconds) when comparing persisted vs. live ``create_time``.
 # Wall-clock based, so a small NTP correction can shift it slightly.
@@ -30,6 +32,12 @@ class ProcessTracker:
     def __init__(self, state_file_path: str):
         self.state_file_path = state_file_path
         self._state: Dict[str, Dict] = {}
+        # Popen objects for processes launched this session; their OS
+        # handles report an exit directly, without a process lookup
+        self._popens: Dict[str, subprocess.Popen] = {}
+        # Launches run on a worker thread while the UI thread checks status,
+        # so every state mutation + save goes through this lock.
+        self._lock = threading.RLock()
         self._load()
         self._revalidate()
 
@@ -38,10 +46,15 @@ class ProcessTracker:
         key: str,
         exe_path: str,
         wait_time: float = 2.0,
+        process_name: Optional[str] = None,
     ) -> bool:
         """Launch ``exe_path`` and remember its PID under ``key``.
 
-        Returns True if the launched process is alive after ``wait_time``.
+        Returns True if the launched process is alive once it has started
+        up, waiting at most ``wait_time``. If it exits during the wait, it
+        may have been a stub that handed off to the real app, so the app
+        counts as launched if ``process_name`` (default: the exe's file
+        name) shows up within another ``wait_time``.
         """
         try:
             proc = subprocess.Popen(
@@ -66,20 +79,34 @@ class ProcessTracker:
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return False
 
-        self._state[key] = {
-            "pid": pid,
-            "create_time": create_time,
-            "exe_path": exe_path,
-        }
-        self._save()
+        ProcessManager.invalidate_snapshot()
+        with self._lock:
+            self._state[key] = {
+                "pid": pid,
+                "create_time": create_time,
+                "exe_path": exe_path,
+            }
+            self._popens[key] = proc
+            self._save()
 
-        time.sleep(wait_time)
-        return self._proc_for(key) is not None
+        ProcessManager.wait_until_ready(proc, wait_time)
+        if proc.poll() is None:
+            return self._proc_for(key) is not None
+        return ProcessManager.wait_for_process(
+            process_name or os.path.basename(exe_path), wait_time
+        )
 
     def is_tracked(self, key: str) -> bool:
         """Whether we currently hold tracking state for ``key``."""
         return key in self._state
 
+    def is_alive(self, key: str) -> bool:
+        """Whether the tracked process for ``key`` is still running.
+
+        Cheaper than ``is_tracked_running``: descendants are not listed.
+        """
+        return key in self._state and self._proc_for(key) is not None
+
     def is_tracked_running(self, key: str) -> Tuple[bool, int]:
         """Return ``(alive, descendant_count)`` for a tracked entry.
 
@@ -142,6 +169,7 @@ class ProcessTracker:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
 
+        ProcessManager.invalidate_snapshot()
         self._drop(key)
         return True
 
@@ -161,6 +189,11 @@ class ProcessTracker:
         entry = self._state.get(key)
         if not entry:
             return None
+        popen = self._popens.get(key)
+        if popen is not None and popen.poll() is not None:
+            # Exited; the handle also rules out a recycled PID
+            self._drop(key)
+            return None
         pid = entry["pid"]
         saved_ct = entry["create_time"]
         try:
@@ -178,9 +211,11 @@ class ProcessTracker:
             return None
 
     def _drop(self, key: str) -> None:
-        if key in self._state:
-            del self._state[key]
-            self._save()
+        with self._lock:
+            self._popens.pop(key, None)
+            if key in self._state:
+                del self._state[key]
+                self._save()
 
     def _revalidate(self) -> None:
         """Drop entries whose process is gone or whose PID was recycled."""
@@ -201,9 +236,10 @@ class ProcessTracker:
 
     def _save(self) -> None:
         tmp_path = self.state_file_path + ".tmp"
-        try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(self._state, f, indent=2)
-            os.replace(tmp_path, self.state_file_path)
-        except OSError as e:
-            print(f"Warning: could not write process state: {e}")
+        with self._lock:
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._state, f, indent=2)
+                os.replace(tmp_path, self.state_file_path)
+            except OSError as e:
+                print(f"Warning: could not write process state: {e}")
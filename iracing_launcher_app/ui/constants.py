@@ -2,6 +2,8 @@
 UI constants and theme configuration.
 """
 
+from types import MappingProxyType
+
 # UI Colors (CustomTkinter compatible)
 # CustomTkinter handles most theming automatically, but we keep custom colors for specific elements
 BG_PRIMARY = "transparent"  # Use CTk's default background
@@ -11,8 +13,8 @@ FG_PRIMARY = "#ffffff"
 FG_SECONDARY = "#cccccc"
 FG_TERTIARY = "#d4d4d4"
 
-# Log level colors
-LOG_COLORS = {
+# Log level colors (read-only)
+LOG_COLORS = MappingProxyType({
     "info": "#d4d4d4",
     "success": "#66BB6A",
     "error": "#EF5350",
@@ -20,17 +22,33 @@ LOG_COLORS = {
     "launch": "#0e639c",  # Blue - matches Launch button
     "close": "#c72e2e",   # Red - matches Close button
     "divider": "#666666"  # Gray for divider lines
-}
+})
 
 # Status color constants
-STATUS_COLORS = {
-    "idle": "#666666",
-    "starting": "#FFA726",
-    "running": "#66BB6A",
-    "failed": "#EF5350",
-    "stopped": "#666666",
-    "not_found": "#666666"
-}
+STATUS_IDLE = "#666666"
+STATUS_STARTING = "#FFA726"
+STATUS_RUNNING = "#66BB6A"
+STATUS_FAILED = "#EF5350"
+
+# Status name to color (read-only)
+STATUS_COLORS = MappingProxyType({
+    "idle": STATUS_IDLE,
+    "starting": STATUS_STARTING,
+    "running": STATUS_RUNNING,
+    "failed": STATUS_FAILED,
+    "stopped": STATUS_IDLE,
+    "not_found": STATUS_IDLE
+})
 
 # Widget dimensions
 STATUS_CARD_HEIGHT = 55
+# Vertical padding of the first, last and other cards in a column
+# (10px between neighbouring cards)
+CARD_PADY_FIRST = (0, 5)
+CARD_PADY_LAST = (5, 0)
+CARD_PADY_MIDDLE = 5
+
+# Timing
+LAUNCH_POLL_MS = 50  # How often the UI checks on background launches
+STATUS_REFRESH_MS = 2000  # How often app/game status dots are re-checked
+CONFIG_SAVE_DELAY_MS = 250  # Checkbox/game changes are saved after this pause
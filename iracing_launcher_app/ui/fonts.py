@@ -0,0 +1,31 @@
+"""
+Shared fonts for the UI.
+
+Widgets given a font tuple each get their own font; widgets given the same
+CTkFont share one named Tk font. Fonts are created on first use, since a
+CTkFont needs the root window to exist.
+"""
+
+import functools
+
+import customtkinter as ctk
+
+
+UI_FONT_FAMILY = "Segoe UI"
+LOG_FONT_FAMILY = "Consolas"
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal", family: str = UI_FONT_FAMILY) -> ctk.CTkFont:
+    """
+    Get the shared font for a size, weight and family.
+
+    Args:
+        size: Font size in points
+        weight: "normal" or "bold"
+        family: Font family name
+
+    Returns:
+        CTkFont shared by every caller asking for the same font
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
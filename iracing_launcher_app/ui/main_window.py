@@ -5,10 +5,10 @@ Main GUI window for iRacing Companion Launcher.
 import os
 import sys
 import customtkinter as ctk
-from tkinter import filedialog
-from typing import Dict, Optional
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Optional, Tuple
 
-from ..core.config_manager import ConfigManager
+from ..core.config_manager import get_config_manager
 from ..core.activity_logger import ActivityLogger
 from ..managers.app_manager import AppManager
 from ..managers.game_manager import GameManager
@@ -19,8 +19,34 @@ from .sections.apps_section import AppsSection
 from .sections.games_section import GamesSection
 from .sections.log_section import LogSection
 from .sections.buttons_section import ButtonsSection
-from .widgets.status_card import StatusCard
-from .widgets.game_card import GameCard
+from .constants import CONFIG_SAVE_DELAY_MS, LAUNCH_POLL_MS, STATUS_REFRESH_MS
+
+if TYPE_CHECKING:
+    # Only used in annotations; the sections create the cards
+    from .widgets.status_card import StatusCard
+    from .widgets.game_card import GameCard
+
+# Window icon: bundled next to the exe by PyInstaller, or at the repo root
+# when running from source
+ICON_PATH = os.path.join(
+    getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+    "iRCL.ico",
+)
+
+# Browse dialog options
+_FILEDIALOG_INITDIR = "C:\\Program Files"
+_APP_FILETYPES = (("Executable files", "*.exe"), ("All files", "*.*"))
+_GAME_FILETYPES = (
+    ("Executable and Shortcuts", "*.exe;*.lnk"),
+    ("Executable files", "*.exe"),
+    ("Shortcuts", "*.lnk"),
+    ("All files", "*.*"),
+)
+
+# How checkbox states are written to [Settings]. getboolean also reads the
+# "True"/"False" of older config files; those are rewritten as 1/0 the next
+# time the checkbox changes
+_BOOL_STR = {True: "1", False: "0"}
 
 
 class iRacingLauncherGUI:
@@ -39,21 +65,40 @@ class iRacingLauncherGUI:
         self.root.resizable(False, False)
 
         # Initialize managers
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.process_tracker = ProcessTracker(
             os.path.join(self.config_manager.get_config_dir(), "process_state.json")
         )
         self.app_manager = AppManager(self.config_manager, self.process_tracker)
         self.game_manager = GameManager(self.config_manager)
+        # The sets of managed apps and games are fixed for the life of the window
+        self._app_list: Tuple[str, ...] = tuple(self.app_manager.get_app_list())
+        self._game_list: Tuple[str, ...] = tuple(self.game_manager.get_game_list())
         self.logger = ActivityLogger()
 
         # UI components
-        self.status_cards: Dict[str, StatusCard] = {}
-        self.game_cards: Dict[str, GameCard] = {}
+        self.status_cards: Dict[str, "StatusCard"] = {}
+        self.game_cards: Dict[str, "GameCard"] = {}
         self.selected_game_var: ctk.StringVar = ctk.StringVar(value="")
+        # Python-side copy of selected_game_var, so reads skip Tcl
+        self._selected_game = ""
         self.select_all_btn: Optional[ctk.CTkButton] = None
         self.launch_btn: Optional[ctk.CTkButton] = None
         self.close_btn: Optional[ctk.CTkButton] = None
+        self._launching = False  # True while a launch sequence is running
+        self._checking = False  # True while the startup status check runs
+        self._closing = False  # True while a close sequence is running
+        self._suppress_checkbox_cb = False  # True during bulk checkbox updates
+        # Last text/state applied to the buttons, to skip no-op configures
+        self._button_state: Optional[tuple] = None
+        self._select_all_text: Optional[str] = None
+        self._config_save_job: Optional[str] = None  # Pending after() id
+        # App name -> "<app>_enabled" key of its checkbox state in [Settings]
+        self._enabled_keys: Dict[str, str] = {}
+        # Running totals over status_cards, kept in step by _set_app_checked
+        # and _set_app_status so button updates don't rescan every card
+        self._checked_count = 0
+        self._enabled_count = 0
 
         # UI Sections
         self.header_section = None
@@ -66,29 +111,20 @@ class iRacingLauncherGUI:
         self._setup_icon()
         self._create_widgets()
         self._initialize_app_states()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
+
+    def _on_window_close(self):
+        """Save any settings change still waiting on its timer, then exit."""
+        self._save_pending_config()
+        self.root.destroy()
 
     def _setup_icon(self):
         """Set the application window icon."""
+        # iconbitmap raises if the file is missing, so no separate exists check
         try:
-            # Determine the base path (works for both script and PyInstaller executable)
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                base_dir = sys._MEIPASS
-            else:
-                # Running as script - load icon from file
-                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-
-            ico_path = os.path.join(base_dir, "iRCL.ico")
-
-            if os.path.exists(ico_path):
-                try:
-                    self.root.iconbitmap(ico_path)
-                except Exception as e:
-                    print(f"iconbitmap failed: {e}")
-            else:
-                print(f"Icon not found at: {ico_path}")
+            self.root.iconbitmap(ICON_PATH)
         except Exception as e:
-            print(f"Could not load icon: {e}")
+            print(f"Could not load icon from {ICON_PATH}: {e}")
 
     def _create_widgets(self):
         """Create and layout all UI widgets."""
@@ -103,7 +139,7 @@ class iRacingLauncherGUI:
         # Create games section
         self.games_section = GamesSection(
             content_frame,
-            self.game_manager.get_game_list(),
+            list(self._game_list),
             self._browse_for_game,
             self._on_game_selected,
             self.selected_game_var
@@ -111,20 +147,29 @@ class iRacingLauncherGUI:
         self.game_cards = self.games_section.get_cards()
 
         # Create apps section
+        self._enabled_keys = {
+            app_name: f"{self.config_manager.get_config_key(app_name)}_enabled"
+            for app_name in self._app_list
+        }
         self.apps_section = AppsSection(
             content_frame,
-            self.app_manager.get_app_list(),
+            list(self._app_list),
             self._browse_for_app,
             self._on_checkbox_change,
             self._toggle_select_all
         )
         self.status_cards = self.apps_section.get_cards()
+        # Cards start out found and checked
+        self._enabled_count = len(self.status_cards)
+        self._checked_count = sum(
+            1 for card in self.status_cards.values() if card.get_checked()
+        )
         self.select_all_btn = self.apps_section.get_select_all_button()
 
         # Create log section
         self.log_section = LogSection(
             content_frame,
-            len(self.app_manager.get_app_list())
+            len(self._app_list)
         )
         self.logger.set_widget(self.log_section.get_widget())
 
@@ -138,86 +183,200 @@ class iRacingLauncherGUI:
         self.close_btn = self.buttons_section.get_close_button()
 
     def _initialize_app_states(self):
-        """Check all apps on startup and set initial states."""
+        """
+        Check all apps on startup and set initial states.
+
+        Path lookups and process checks run on worker threads (apps first,
+        then games) so the window is responsive while they run. Launch and
+        Close stay disabled until the check has finished.
+        """
+        self._checking = True
         self.logger.log_divider()
         self.logger.info("Checking application status...")
+        self._update_button_text()
 
-        for app_name in self.app_manager.get_app_list():
-            app_path = self.app_manager.find_app_path(app_name)
-            config_key = f"{app_name.lower().replace(' ', '_')}_enabled"
+        self._poll_startup_check(
+            self.app_manager.check_apps_async(self._app_list),
+            self._apply_app_states
+        )
 
-            if not app_path:
-                self.status_cards[app_name].set_status("not_found")
-                self.logger.warning(f"{app_name} - not configured")
-                # Not-found apps should not be selected - save this to config
-                self.config_manager.config.set('Settings', config_key, 'False')
-            else:
-                if self.app_manager.is_app_running(app_name):
-                    child_names = self.app_manager.get_child_names(app_name)
-                    self.status_cards[app_name].set_status(
-                        "running",
-                        child_count=len(child_names),
-                    )
-                    self.logger.success(f"{app_name} - already running")
-                    if child_names:
-                        self.logger.info(
-                            f"  helpers: {', '.join(child_names)}"
-                        )
-                else:
-                    self.status_cards[app_name].set_status("idle")
-                    self.logger.info(f"{app_name} - configured")
+    def _poll_startup_check(self, future: Future, apply: Callable[[list], None]):
+        """Pass a finished startup check's results to apply, or check again shortly."""
+        if not future.done():
+            self.root.after(LAUNCH_POLL_MS, self._poll_startup_check, future, apply)
+            return
+
+        try:
+            results = future.result()
+        except Exception as e:
+            self.logger.error(f"Status check failed: {e}")
+            results = []
+        apply(results)
 
-                # Only restore checkbox state for found apps
-                enabled = self.config_manager.config.getboolean('Settings', config_key, fallback=True)
-                self.status_cards[app_name].set_checked(enabled)
+    def _apply_app_states(self, results: list):
+        """Set app cards from check_apps results, then start the game check."""
+        self.logger.begin_batch()
+        try:
+            for app_name, app_path, running, child_names in results:
+                config_key = self._enabled_keys[app_name]
 
-        # Save config after initialization
-        self.config_manager.save_config()
+                if not app_path:
+                    self._set_app_status(app_name, "not_found")
+                    self.logger.warning(f"{app_name} - not configured")
+                    # Not-found apps should not be selected - save this to config
+                    self.config_manager.set_setting(config_key, _BOOL_STR[False])
+                else:
+                    if running:
+                        self.status_cards[app_name].set_status(
+                            "running",
+                            child_count=len(child_names),
+                        )
+                        self.logger.success(f"{app_name} - already running")
+                        if child_names:
+                            self.logger.info(
+                                f"  helpers: {', '.join(child_names)}"
+                            )
+                    else:
+                        self.status_cards[app_name].set_status("idle")
+                        self.logger.info(f"{app_name} - configured")
+
+                    # Only restore checkbox state for found apps
+                    enabled = self.config_manager.config.getboolean('Settings', config_key, fallback=True)
+                    self._set_app_checked(app_name, enabled)
+        finally:
+            self.logger.end_batch()
 
-        # Initialize game states
-        for game_name in self.game_manager.get_game_list():
-            game_path = self.game_manager.find_game_path(game_name)
-            if not game_path:
-                self.game_cards[game_name].set_status("not_found")
-                self.logger.warning(f"{game_name} - not configured")
-            else:
-                if self.game_manager.is_game_running(game_name):
+        self._update_select_all_button()
+        self._poll_startup_check(
+            self.game_manager.check_games_async(self._game_list),
+            self._apply_game_states
+        )
+
+    def _apply_game_states(self, results: list):
+        """Set game cards from check_games results and finish startup."""
+        self.logger.begin_batch()
+        try:
+            for game_name, game_path, running in results:
+                if not game_path:
+                    self.game_cards[game_name].set_status("not_found")
+                    self.logger.warning(f"{game_name} - not configured")
+                elif running:
                     self.game_cards[game_name].set_status("running")
                     self.logger.success(f"{game_name} - already running")
                 else:
                     self.game_cards[game_name].set_status("idle")
                     self.logger.info(f"{game_name} - configured")
+        finally:
+            self.logger.end_batch()
+
+        # Save everything discovered above in one write
+        self.config_manager.save_config()
 
         # Restore selected game from config
         saved_game = self.config_manager.config.get('Settings', 'selected_game', fallback='')
-        if saved_game and saved_game in self.game_cards:
-            self.selected_game_var.set(saved_game)
-        else:
-            self.selected_game_var.set('')
+        if saved_game not in self.game_cards:
+            saved_game = ''
+        self._selected_game = saved_game
+        self.selected_game_var.set(saved_game)
 
+        self._checking = False
         self._update_button_text()
         self._update_select_all_button()
 
+        # Keep status dots current when apps/games are started or closed
+        # outside the launcher
+        self.root.after(
+            STATUS_REFRESH_MS,
+            self.app_manager.schedule_status_refresh,
+            self.root, self._apply_running_status, STATUS_REFRESH_MS
+        )
+
+    def _apply_running_status(
+        self, running_apps: Dict[str, int], running_names: FrozenSet[str]
+    ):
+        """
+        Update cards whose running state changed since the last refresh.
+
+        Cards that are mid-launch or mid-close, or not configured, are left
+        alone so the refresh never overrides an in-progress action.
+
+        Args:
+            running_apps: Helper process count of each running companion app
+            running_names: Snapshot of running exe names the worker took
+        """
+        for app_name, card in self.status_cards.items():
+            status = card.get_status()
+            if status in ("starting", "stopping", "not_found"):
+                continue
+            if app_name in running_apps:
+                if status != "running":
+                    card.set_status(
+                        "running",
+                        child_count=running_apps[app_name],
+                    )
+            elif status == "running":
+                card.set_status("stopped")
+
+        # Checked against the worker's snapshot, so no walk happens here
+        running_games = self.game_manager.get_running_games(running_names)
+        for game_name, card in self.game_cards.items():
+            status = card.get_status()
+            if status in ("starting", "stopping", "not_found"):
+                continue
+            if game_name in running_games:
+                if status != "running":
+                    card.set_status("running")
+            elif status == "running":
+                card.set_status("stopped")
+
+    def _set_app_checked(self, app_name: str, checked: bool):
+        """
+        Set an app's checkbox without triggering _on_checkbox_change.
+
+        Args:
+            app_name: Name of the application
+            checked: True to check, False to uncheck
+        """
+        card = self.status_cards[app_name]
+        self._checked_count += int(checked) - int(card.get_checked())
+        self._suppress_checkbox_cb = True
+        try:
+            card.set_checked(checked)
+        finally:
+            self._suppress_checkbox_cb = False
+
+    def _set_app_status(self, app_name: str, status: str, **kwargs):
+        """
+        Set an app card's status where it may enter or leave "not_found".
+
+        A not-found card is also unchecked and disabled, so the counters
+        are adjusted by whatever the card changed.
+
+        Args:
+            app_name: Name of the application
+            status: New status string
+            **kwargs: Passed through to StatusCard.set_status
+        """
+        card = self.status_cards[app_name]
+        was_found, was_checked = not card.is_not_found, card.get_checked()
+        card.set_status(status, **kwargs)
+        self._enabled_count += int(not card.is_not_found) - int(was_found)
+        self._checked_count += int(card.get_checked()) - int(was_checked)
+
     def _toggle_select_all(self):
         """Toggle all app checkboxes between selected and deselected."""
-        enabled_cards = [
-            card for card in self.status_cards.values()
-            if not card.is_not_found
-        ]
-
-        if not enabled_cards:
+        if not self._enabled_count:
             return
 
-        checked_count = sum(1 for card in enabled_cards if card.get_checked())
-        select_all = checked_count < len(enabled_cards)
+        select_all = self._checked_count < self._enabled_count
 
+        # _set_app_checked skips the per-card save; save and refresh once
         for app_name, card in self.status_cards.items():
             if not card.is_not_found:
-                card.set_checked(select_all)
-                config_key = f"{app_name.lower().replace(' ', '_')}_enabled"
-                self.config_manager.config.set('Settings', config_key, str(select_all))
+                self._set_app_checked(app_name, select_all)
+                self.config_manager.set_setting(self._enabled_keys[app_name], _BOOL_STR[select_all])
 
-        self.config_manager.save_config()
+        self._schedule_config_save()
         self._update_button_text()
         self._update_select_all_button()
 
@@ -226,77 +385,102 @@ class iRacingLauncherGUI:
         if not self.select_all_btn:
             return
 
-        enabled_cards = [
-            card for card in self.status_cards.values()
-            if not card.is_not_found
-        ]
-
-        if not enabled_cards:
-            self.select_all_btn.configure(text="Select All")
-            return
-
-        checked_count = sum(1 for card in enabled_cards if card.get_checked())
-
-        if checked_count == len(enabled_cards):
-            self.select_all_btn.configure(text="Deselect All")
+        if self._enabled_count and self._checked_count == self._enabled_count:
+            text = "Deselect All"
         else:
-            self.select_all_btn.configure(text="Select All")
+            text = "Select All"
+
+        # Skip the Tk call when nothing changed
+        if text != self._select_all_text:
+            self._select_all_text = text
+            self.select_all_btn.configure(text=text)
 
     def _update_button_text(self):
         """Update button text to show number of selected apps and selected game."""
         if not self.launch_btn or not self.close_btn:
             return
 
-        checked_count = sum(
-            1 for card in self.status_cards.values()
-            if card.get_checked()
-        )
+        checked_count = self._checked_count
 
-        selected_game = self.selected_game_var.get()
+        selected_game = self._selected_game
 
         if selected_game:
-            self.launch_btn.configure(text=f"Launch with {selected_game} ({checked_count})")
+            launch_text = f"Launch with {selected_game} ({checked_count})"
         else:
-            self.launch_btn.configure(text=f"Launch apps ({checked_count})")
+            launch_text = f"Launch apps ({checked_count})"
 
-        self.close_btn.configure(text=f"Close all ({checked_count})")
-
-        if checked_count == 0 and not selected_game:
-            self.launch_btn.configure(state="disabled")
-            self.close_btn.configure(state="disabled")
+        if self._checking or (checked_count == 0 and not selected_game):
+            launch_state = close_state = "disabled"
         else:
-            self.launch_btn.configure(state="normal")
-            self.close_btn.configure(state="normal")
+            # Keep buttons disabled until a running sequence has finished
+            busy = self._launching or self._closing
+            launch_state = close_state = "disabled" if busy else "normal"
+
+        # Skip the Tk calls when nothing changed
+        button_state = (launch_text, launch_state, checked_count, close_state)
+        if button_state == self._button_state:
+            return
+        self._button_state = button_state
+
+        self.launch_btn.configure(text=launch_text, state=launch_state)
+        self.close_btn.configure(text=f"Close all ({checked_count})", state=close_state)
 
     def _on_checkbox_change(self, app_name: str, checked: bool):
         """Handle checkbox state change and save to config."""
-        config_key = f"{app_name.lower().replace(' ', '_')}_enabled"
-        self.config_manager.config.set('Settings', config_key, str(checked))
-        self.config_manager.save_config()
+        if self._suppress_checkbox_cb:
+            return
+        # A click always flips the box, so the count moves by one
+        self._checked_count += 1 if checked else -1
+        if self.config_manager.set_setting(self._enabled_keys[app_name], _BOOL_STR[checked]):
+            self._schedule_config_save()
         self._update_button_text()
         self._update_select_all_button()
 
     def _on_game_selected(self, game_name: str):
         """Handle game radio button selection."""
-        self.config_manager.config.set('Settings', 'selected_game', game_name)
-        self.config_manager.save_config()
+        self._selected_game = game_name
+        if self.config_manager.set_setting('selected_game', game_name):
+            self._schedule_config_save()
         self._update_button_text()
 
+    def _schedule_config_save(self):
+        """Write config.ini once changes have paused for CONFIG_SAVE_DELAY_MS."""
+        if self._config_save_job is not None:
+            self.root.after_cancel(self._config_save_job)
+        self._config_save_job = self.root.after(
+            CONFIG_SAVE_DELAY_MS, self._save_pending_config
+        )
+
+    def _save_pending_config(self):
+        """Flush settings changed since the last save, cancelling any timer."""
+        if self._config_save_job is not None:
+            self.root.after_cancel(self._config_save_job)
+            self._config_save_job = None
+        self.config_manager.flush()
+
     def _browse_for_app(self, app_name: str):
         """Open file dialog to manually select app executable."""
         expected_exe = self.app_manager.get_app_exe(app_name)
         if not expected_exe:
             return
 
+        # The file dialog module is only loaded once someone browses
+        from tkinter import filedialog
+
+        config_key = self.app_manager.get_app_config_key(app_name)
         file_path = filedialog.askopenfilename(
             title=f"Select {app_name} executable",
-            filetypes=[("Executable files", "*.exe"), ("All files", "*.*")],
-            initialdir="C:\\Program Files"
+            filetypes=_APP_FILETYPES,
+            initialdir=self.config_manager.get_last_browse_dir(config_key, _FILEDIALOG_INITDIR)
         )
 
         if not file_path:
             return
 
+        # Reopen in this folder next time, even if the pick was wrong
+        if self.config_manager.set_last_browse_dir(config_key, os.path.dirname(file_path)):
+            self._schedule_config_save()
+
         selected_exe = os.path.basename(file_path)
         if selected_exe.lower() != expected_exe.lower():
             self.logger.error(
@@ -304,19 +488,15 @@ class iRacingLauncherGUI:
             )
             return
 
-        if not os.path.exists(file_path):
-            self.logger.error(f"Selected file does not exist: {file_path}")
-            return
-
-        config_key = ConfigManager.get_config_key(app_name)
+        # The dialog only returns files that exist, so no stat is needed
         self.config_manager.set_app_path(config_key, file_path)
 
-        self.status_cards[app_name].set_status("idle")
-        self.status_cards[app_name].set_checked(True)
+        self._set_app_status(app_name, "idle")
+        self._set_app_checked(app_name, True)
 
-        checkbox_config_key = f"{app_name.lower().replace(' ', '_')}_enabled"
-        self.config_manager.config.set('Settings', checkbox_config_key, str(True))
-        self.config_manager.save_config()
+        # Path and checkbox state go to disk in one write
+        self.config_manager.set_setting(self._enabled_keys[app_name], _BOOL_STR[True])
+        self._schedule_config_save()
 
         self.logger.success(f"{app_name} path configured: {file_path}")
         self._update_button_text()
@@ -328,25 +508,24 @@ class iRacingLauncherGUI:
         if not expected_exe:
             return
 
+        from tkinter import filedialog
+
+        config_key = self.game_manager.get_game_config_key(game_name)
         file_path = filedialog.askopenfilename(
             title=f"Select {game_name} executable or shortcut",
-            filetypes=[
-                ("Executable and Shortcuts", "*.exe;*.lnk"),
-                ("Executable files", "*.exe"),
-                ("Shortcuts", "*.lnk"),
-                ("All files", "*.*")
-            ],
-            initialdir="C:\\Program Files"
+            filetypes=_GAME_FILETYPES,
+            initialdir=self.config_manager.get_last_browse_dir(config_key, _FILEDIALOG_INITDIR)
         )
 
         if not file_path:
             return
 
-        if file_path.lower().endswith('.lnk'):
-            if not os.path.exists(file_path):
-                self.logger.error(f"Selected file does not exist: {file_path}")
-                return
-        else:
+        if self.config_manager.set_last_browse_dir(config_key, os.path.dirname(file_path)):
+            self._schedule_config_save()
+
+        # Any shortcut is accepted; an exe must be the game's own. The dialog
+        # only returns files that exist, so no stat is needed
+        if not file_path.lower().endswith('.lnk'):
             selected_exe = os.path.basename(file_path)
             if selected_exe.lower() != expected_exe.lower():
                 self.logger.error(
@@ -354,12 +533,8 @@ class iRacingLauncherGUI:
                 )
                 return
 
-            if not os.path.exists(file_path):
-                self.logger.error(f"Selected file does not exist: {file_path}")
-                return
-
-        config_key = f"game_{ConfigManager.get_config_key(game_name)}"
         self.config_manager.set_app_path(config_key, file_path)
+        self._schedule_config_save()
 
         self.game_cards[game_name].set_status("idle")
         self.logger.success(f"{game_name} path configured: {file_path}")
@@ -367,44 +542,57 @@ class iRacingLauncherGUI:
 
     def launch_apps(self):
         """Launch all configured companion applications."""
-        if not self.launch_btn:
+        if not self.launch_btn or self._launching or self._checking or self._closing:
             return
 
-        self.launch_btn.configure(state="disabled")
+        self._launching = True
+        self._update_button_text()
+        self._save_pending_config()
 
-        self.logger.log_divider()
-        self.logger.launch("Starting launch sequence...")
+        self.logger.begin_batch()
+        try:
+            self.logger.log_divider()
+            self.logger.launch("Starting launch sequence...")
 
-        for app_name in self.app_manager.get_app_list():
-            if not self.status_cards[app_name].get_checked():
-                continue
+            # Launches run on worker threads; results are applied as they finish
+            pending: Dict[str, Future] = {}
+            for app_name, card in self.status_cards.items():
+                if not card.get_checked():
+                    continue
 
-            app_path = self.app_manager.find_app_path(app_name)
+                app_path = self.app_manager.find_app_path(app_name)
 
-            if not app_path:
-                self.logger.warning(f"Skipping {app_name} - not configured")
-                continue
+                if not app_path:
+                    self.logger.warning(f"Skipping {app_name} - not configured")
+                    continue
 
-            if self.app_manager.is_app_running(app_name):
-                self.logger.info(f"Skipping {app_name} - already running")
-                child_names = self.app_manager.get_child_names(app_name)
-                if child_names:
-                    self.logger.info(
-                        f"  helpers: {', '.join(child_names)}"
-                    )
-                self.status_cards[app_name].set_status(
-                    "running",
-                    child_count=len(child_names),
-                )
+                # The worker skips apps that are already running
+                card.set_status("starting")
+                self.logger.info(f"Launching {app_name}...")
+                pending[app_name] = self.app_manager.launch_app_async(app_name, app_path)
+        finally:
+            self.logger.end_batch()
+
+        self._poll_app_launches(pending)
+
+    def _poll_app_launches(self, pending: Dict[str, Future]):
+        """Apply finished app launches and check the rest again shortly."""
+        for app_name, future in list(pending.items()):
+            if not future.done():
                 continue
+            del pending[app_name]
 
-            self.status_cards[app_name].set_status("starting")
-            self.logger.info(f"Launching {app_name}...")
+            try:
+                already_running, success, child_names = future.result()
+            except Exception as e:
+                self.logger.error(f"{app_name} could not be launched: {e}")
+                already_running, success, child_names = False, False, []
 
-            success = self.app_manager.launch_app(app_name, app_path)
-            if success:
+            if already_running:
+                self.logger.info(f"{app_name} is already running")
+            elif success:
                 self.logger.success(f"{app_name} started successfully")
-                child_names = self.app_manager.get_child_names(app_name)
+            if success:
                 if child_names:
                     self.logger.info(
                         f"  helpers: {', '.join(child_names)}"
@@ -418,34 +606,56 @@ class iRacingLauncherGUI:
                 self.logger.warning(f"Try reinstalling {app_name}")
                 self.status_cards[app_name].set_status("failed")
 
+        if pending:
+            self.root.after(LAUNCH_POLL_MS, self._poll_app_launches, pending)
+            return
+
         self.logger.success("All apps launched!")
 
         # Launch selected game after apps if one is selected
-        selected_game = self.selected_game_var.get()
+        selected_game = self._selected_game
         if selected_game:
-            self._launch_selected_game(selected_game)
+            future = self._launch_selected_game(selected_game)
+            if future:
+                self._poll_game_launch(selected_game, future)
+                return
 
-        self.logger.success("Launch sequence complete!")
-        self.launch_btn.configure(state="normal")
+        self._finish_launch_sequence()
+
+    def _launch_selected_game(self, game_name: str) -> Optional[Future]:
+        """
+        Start launching the selected game.
 
-    def _launch_selected_game(self, game_name: str):
-        """Launch the selected game."""
+        Returns:
+            Future for the launch, or None if the game was skipped
+        """
         game_path = self.game_manager.find_game_path(game_name)
 
         if not game_path:
             self.logger.warning(f"Skipping {game_name} - not configured")
-            return
-
-        if self.game_manager.is_game_running(game_name):
-            self.logger.info(f"Skipping {game_name} - already running")
-            self.game_cards[game_name].set_status("running")
-            return
+            return None
 
+        # The worker skips the game if it is already running
         self.game_cards[game_name].set_status("starting")
         self.logger.launch(f"Launching {game_name}...")
+        return self.game_manager.launch_game_async(game_name, game_path)
+
+    def _poll_game_launch(self, game_name: str, future: Future):
+        """Apply the game launch result once it has finished."""
+        if not future.done():
+            self.root.after(LAUNCH_POLL_MS, self._poll_game_launch, game_name, future)
+            return
 
-        success = self.game_manager.launch_game(game_name, game_path)
-        if success:
+        try:
+            already_running, success = future.result()
+        except Exception as e:
+            self.logger.error(f"{game_name} could not be launched: {e}")
+            already_running, success = False, False
+
+        if already_running:
+            self.logger.info(f"{game_name} is already running")
+            self.game_cards[game_name].set_status("running")
+        elif success:
             self.logger.success(f"{game_name} started successfully")
             self.game_cards[game_name].set_status("running")
         else:
@@ -453,65 +663,123 @@ class iRacingLauncherGUI:
             self.logger.warning(f"Try reinstalling {game_name} or selecting a different path")
             self.game_cards[game_name].set_status("failed")
 
+        self._finish_launch_sequence()
+
+    def _finish_launch_sequence(self):
+        """Log completion and re-enable the Launch button."""
+        self.logger.success("Launch sequence complete!")
+        self._launching = False
+        self._update_button_text()
+
     def close_apps(self):
         """Close all companion applications."""
-        if not self.close_btn:
+        if not self.close_btn or self._launching or self._checking or self._closing:
             return
 
-        self.close_btn.configure(state="disabled")
+        self._closing = True
+        self._update_button_text()
+        self._save_pending_config()
 
         self.logger.log_divider()
         self.logger.close("Closing applications...")
 
-        for app_name in self.app_manager.get_app_list():
-            if not self.status_cards[app_name].get_checked():
+        # Closes run on worker threads; results are applied as they finish
+        pending: Dict[str, Tuple[Future, Optional[str]]] = {}
+        for app_name, card in self.status_cards.items():
+            if not card.get_checked():
                 continue
 
             app_path = self.app_manager.find_app_path(app_name)
-            if not app_path:
-                killed = self.app_manager.close_app(app_name)
-                if not killed:
-                    continue
-
-            self.status_cards[app_name].set_status("stopping")
-            self.logger.info(f"Closing {app_name}...")
-            child_names = self.app_manager.get_child_names(app_name)
-            if child_names:
-                self.logger.info(
-                    f"  helpers to close: {', '.join(child_names)}"
-                )
+            if app_path:
+                card.set_status("stopping")
+                self.logger.info(f"Closing {app_name}...")
+            # Unconfigured apps are still closed if a tracked or same-named
+            # process is running; they are only reported if one was found
+            pending[app_name] = (self.app_manager.close_app_async(app_name), app_path)
+
+        self._poll_app_closes(pending)
+
+    def _poll_app_closes(self, pending: Dict[str, Tuple[Future, Optional[str]]]):
+        """Apply finished app closes and check the rest again shortly."""
+        for app_name, (future, app_path) in list(pending.items()):
+            if not future.done():
+                continue
+            del pending[app_name]
 
-            killed = self.app_manager.close_app(app_name)
+            try:
+                killed, child_names = future.result()
+            except Exception as e:
+                self.logger.error(f"{app_name} could not be closed: {e}")
+                killed, child_names = False, []
 
             if killed:
                 self.logger.success(f"{app_name} closed")
+                if child_names:
+                    self.logger.info(
+                        f"  helpers closed: {', '.join(child_names)}"
+                    )
+
+            if not app_path:
+                continue
+
+            if killed:
                 self.status_cards[app_name].set_status("stopped")
             else:
                 self.logger.warning(f"{app_name} was not running")
-                if not app_path:
-                    self.status_cards[app_name].set_status("not_found")
-                else:
-                    self.status_cards[app_name].set_status("idle")
+                self._set_app_status(app_name, "idle")
+
+        if pending:
+            self.root.after(LAUNCH_POLL_MS, self._poll_app_closes, pending)
+            return
+
+        self._finish_close_sequence()
 
+    def _finish_close_sequence(self):
+        """Check the selected game once all apps are closed."""
         # Helper processes (e.g. Garage61's versioned agent) are killed
         # automatically by ProcessTracker when it walks the launched
         # process tree, so no per-app special cases are needed here.
 
-        # Check game status after closing apps
-        selected_game = self.selected_game_var.get()
-        if selected_game and selected_game in self.game_cards:
-            # If card shows running, check if game is actually still running
-            if self.game_cards[selected_game].get_status() == "running":
-                game_is_running_now = self.game_manager.is_game_running(selected_game)
-
-                if not game_is_running_now:
-                    # Game was closed manually
-                    self.logger.success(f"{selected_game} was closed manually")
-                    self.game_cards[selected_game].set_status("idle")
-                else:
-                    # Game is still running - warn user
-                    self.logger.warning(f"⚠ {selected_game} is still running - please close it manually")
-            # If card doesn't show running, do nothing (game wasn't running)
+        # Check game status after closing apps. If the card doesn't show
+        # running, there is nothing to check (the game wasn't running).
+        selected_game = self._selected_game
+        if (
+            selected_game
+            and selected_game in self.game_cards
+            and self.game_cards[selected_game].get_status() == "running"
+        ):
+            # The card shows running; check on a worker whether it still is
+            future = self.game_manager.is_game_running_async(selected_game)
+            self._poll_game_close_check(selected_game, future)
+            return
+
+        self._end_close_sequence()
 
+    def _poll_game_close_check(self, game_name: str, future: Future):
+        """Report whether the selected game is still running, once checked."""
+        if not future.done():
+            self.root.after(
+                LAUNCH_POLL_MS, self._poll_game_close_check, game_name, future
+            )
+            return
+
+        try:
+            game_is_running_now = future.result()
+        except Exception as e:
+            self.logger.error(f"Could not check {game_name}: {e}")
+        else:
+            if not game_is_running_now:
+                # Game was closed manually
+                self.logger.success(f"{game_name} was closed manually")
+                self.game_cards[game_name].set_status("idle")
+            else:
+                # Game is still running - warn user
+                self.logger.warning(f"⚠ {game_name} is still running - please close it manually")
+
+        self._end_close_sequence()
+
+    def _end_close_sequence(self):
+        """Log completion and re-enable the Close button."""
         self.logger.success("All apps closed!")
-        self.close_btn.configure(state="normal")
+        self._closing = False
+        self._update_button_text()
@@ -2,7 +2,14 @@
 
 import customtkinter as ctk
 from typing import Dict, Callable
-from ..constants import FG_SECONDARY
+from ..constants import (
+    CARD_PADY_FIRST,
+    CARD_PADY_LAST,
+    CARD_PADY_MIDDLE,
+    FG_SECONDARY,
+    STATUS_CARD_HEIGHT,
+)
+from ..fonts import get_font
 from ..widgets.status_card import StatusCard
 
 
@@ -50,7 +57,7 @@ class AppsSection:
         apps_label = ctk.CTkLabel(
             header_frame,
             text="Companion Apps",
-            font=("Segoe UI", 16, "bold"),
+            font=get_font(16, "bold"),
             text_color=FG_SECONDARY,
             anchor="w"
         )
@@ -64,7 +71,7 @@ class AppsSection:
             hover_color="#666666",
             width=100,
             height=30,
-            font=("Segoe UI", 12),
+            font=get_font(12),
             corner_radius=6
         )
         self.select_all_btn.pack(side="right")
@@ -72,6 +79,13 @@ class AppsSection:
         cards_frame = ctk.CTkFrame(self.container, fg_color="transparent")
         cards_frame.pack(fill="both", expand=True)
 
+        # Fix the grid up front so adding cards doesn't renegotiate sizes
+        cards_frame.grid_columnconfigure(0, weight=1)
+        for idx in range(len(self.app_list)):
+            cards_frame.grid_rowconfigure(idx, minsize=STATUS_CARD_HEIGHT)
+
+        # First card: no top padding; Last card: no bottom padding
+        last = len(self.app_list) - 1
         for idx, app_name in enumerate(self.app_list):
             card = StatusCard(
                 cards_frame,
@@ -79,15 +93,14 @@ class AppsSection:
                 browse_callback=self.browse_callback,
                 checkbox_callback=self.checkbox_callback
             )
-            # First card: no top padding; Last card: no bottom padding
             if idx == 0:
-                pady = (0, 5)
-            elif idx == len(self.app_list) - 1:
-                pady = (5, 0)
+                pady = CARD_PADY_FIRST
+            elif idx == last:
+                pady = CARD_PADY_LAST
             else:
-                pady = 5
+                pady = CARD_PADY_MIDDLE
 
-            card.pack(fill="x", pady=pady)
+            card.grid(row=idx, column=0, sticky="ew", pady=pady)
             self.status_cards[app_name] = card
 
     def get_cards(self) -> Dict[str, StatusCard]:
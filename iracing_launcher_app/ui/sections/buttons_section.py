@@ -2,6 +2,7 @@
 
 import customtkinter as ctk
 from typing import Callable
+from ..fonts import get_font
 
 
 class ButtonsSection:
@@ -42,7 +43,7 @@ class ButtonsSection:
             hover_color="#1177bb",
             width=200,
             height=60,
-            font=("Segoe UI", 16, "bold"),
+            font=get_font(16, "bold"),
             corner_radius=12
         )
         self.launch_btn.pack(side="left", padx=10)
@@ -55,7 +56,7 @@ class ButtonsSection:
             hover_color="#e04343",
             width=200,
             height=60,
-            font=("Segoe UI", 16, "bold"),
+            font=get_font(16, "bold"),
             corner_radius=12
         )
         self.close_btn.pack(side="left", padx=10)
@@ -1,6 +1,7 @@
 """Footer section of the main window."""
 
 import customtkinter as ctk
+from ..fonts import get_font
 
 
 class FooterSection:
@@ -25,7 +26,7 @@ class FooterSection:
         copyright_label = ctk.CTkLabel(
             self.frame,
             text="© 2026 Developed & Designed by Tobias Termeczky • Vibed with Claude",
-            font=("Segoe UI", 10),
+            font=get_font(10),
             text_color="#888888",
             anchor="e"
         )
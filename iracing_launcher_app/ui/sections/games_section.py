@@ -2,7 +2,14 @@
 
 import customtkinter as ctk
 from typing import Dict, Callable
-from ..constants import FG_SECONDARY, STATUS_CARD_HEIGHT
+from ..constants import (
+    CARD_PADY_FIRST,
+    CARD_PADY_LAST,
+    CARD_PADY_MIDDLE,
+    FG_SECONDARY,
+    STATUS_CARD_HEIGHT,
+)
+from ..fonts import get_font
 from ..widgets.game_card import GameCard
 
 
@@ -49,7 +56,7 @@ class GamesSection:
         games_label = ctk.CTkLabel(
             header_frame,
             text="Racing Simulators & Games",
-            font=("Segoe UI", 16, "bold"),
+            font=get_font(16, "bold"),
             text_color=FG_SECONDARY,
             anchor="w"
         )
@@ -59,38 +66,24 @@ class GamesSection:
         cards_frame = ctk.CTkFrame(self.container, fg_color="transparent")
         cards_frame.pack(fill="both", expand=True)
 
+        # One fixed-height grid row for "None" plus one per game, set up
+        # before any card is created
+        cards_frame.grid_columnconfigure(0, weight=1)
+        for row in range(len(self.game_list) + 1):
+            cards_frame.grid_rowconfigure(row, minsize=STATUS_CARD_HEIGHT)
+
         # Add "None" option at the top
-        none_frame = ctk.CTkFrame(
+        none_card = GameCard(
             cards_frame,
-            fg_color="#2d2d30",
-            border_width=1,
-            border_color="#3e3e42",
-            height=STATUS_CARD_HEIGHT,
-            corner_radius=6
-        )
-        none_frame.pack(fill="x", pady=(0, 5))
-        none_frame.pack_propagate(False)
-
-        none_radio = ctk.CTkRadioButton(
-            none_frame,
-            text="",
-            width=20,
-            value="",
-            variable=self.radio_variable,
-            command=lambda: self.radio_callback("")
+            "",
+            radio_callback=self.radio_callback,
+            radio_variable=self.radio_variable,
+            is_none=True
         )
-        none_radio.pack(side="left", padx=(10, 5), pady=10)
-
-        none_label = ctk.CTkLabel(
-            none_frame,
-            text="None",
-            text_color="#ffffff",
-            font=("Segoe UI", 14, "bold"),
-            anchor="w"
-        )
-        none_label.pack(side="left", padx=(5, 15), pady=10)
+        none_card.grid(row=0, column=0, sticky="ew", pady=CARD_PADY_FIRST)
 
         # Add actual games
+        last = len(self.game_list) - 1
         for idx, game_name in enumerate(self.game_list):
             card = GameCard(
                 cards_frame,
@@ -100,12 +93,8 @@ class GamesSection:
                 radio_variable=self.radio_variable
             )
             # Last card: no bottom padding
-            if idx == len(self.game_list) - 1:
-                pady = (5, 0)
-            else:
-                pady = 5
-
-            card.pack(fill="x", pady=pady)
+            pady = CARD_PADY_LAST if idx == last else CARD_PADY_MIDDLE
+            card.grid(row=idx + 1, column=0, sticky="ew", pady=pady)
             self.game_cards[game_name] = card
 
     def get_cards(self) -> Dict[str, GameCard]:
@@ -3,6 +3,7 @@
 import customtkinter as ctk
 from version import __version__
 from ..constants import BG_SECONDARY, FG_PRIMARY
+from ..fonts import get_font
 
 
 class HeaderSection:
@@ -28,7 +29,7 @@ class HeaderSection:
         title_label = ctk.CTkLabel(
             self.frame,
             text=f"iRacing Companion Launcher v{__version__}",
-            font=("Segoe UI", 24, "bold"),
+            font=get_font(24, "bold"),
             text_color=FG_PRIMARY
         )
         title_label.pack(pady=20)
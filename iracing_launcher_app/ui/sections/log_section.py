@@ -2,6 +2,7 @@
 
 import customtkinter as ctk
 from ..constants import BG_TERTIARY, FG_SECONDARY, FG_TERTIARY, STATUS_CARD_HEIGHT
+from ..fonts import LOG_FONT_FAMILY, get_font
 
 
 class LogSection:
@@ -29,7 +30,7 @@ class LogSection:
         log_label = ctk.CTkLabel(
             self.container,
             text="Activity Log",
-            font=("Segoe UI", 16, "bold"),
+            font=get_font(16, "bold"),
             text_color=FG_SECONDARY,
             anchor="w"
         )
@@ -46,7 +47,7 @@ class LogSection:
             self.container,
             width=400,
             height=total_height,
-            font=("Consolas", 14),
+            font=get_font(14, family=LOG_FONT_FAMILY),
             fg_color=BG_TERTIARY,
             text_color=FG_TERTIARY,
             border_width=0,
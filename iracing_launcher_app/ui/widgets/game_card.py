@@ -2,14 +2,52 @@
 Game card widget for racing simulators.
 """
 
+import functools
+
 import customtkinter as ctk
-from ..constants import STATUS_COLORS, STATUS_CARD_HEIGHT
+from ..constants import STATUS_COLORS, STATUS_IDLE, STATUS_CARD_HEIGHT
+from ..fonts import get_font
+
+
+@functools.lru_cache(maxsize=None)
+def _wrap_text(text: str, max_length: int = 18) -> str:
+    """
+    Wrap text to multiple lines if longer than max_length.
+    Breaks on spaces if possible.
+
+    Args:
+        text: Text to wrap
+        max_length: Maximum characters per line
+
+    Returns:
+        Wrapped text with newlines
+    """
+    if len(text) <= max_length:
+        return text
+
+    # Find the last space before max_length
+    break_point = text.rfind(' ', 0, max_length)
+
+    if break_point == -1:
+        # No space found, just break at max_length
+        return text[:max_length] + '\n' + text[max_length:]
+    else:
+        # Break at the space
+        return text[:break_point] + '\n' + text[break_point + 1:]
 
 
 class GameCard(ctk.CTkFrame):
     """Widget to display race game with radio button selection."""
 
-    def __init__(self, parent, game_name, browse_callback=None, radio_callback=None, radio_variable=None):
+    def __init__(
+        self,
+        parent,
+        game_name,
+        browse_callback=None,
+        radio_callback=None,
+        radio_variable=None,
+        is_none=False
+    ):
         """
         Initialize a game card.
 
@@ -19,17 +57,20 @@ class GameCard(ctk.CTkFrame):
             browse_callback: Optional callback for Browse button
             radio_callback: Optional callback when radio button is selected
             radio_variable: Shared StringVar for radio button group
+            is_none: Build the "None" option instead: selects "" and has
+                no status indicator
         """
         super().__init__(
             parent,
             fg_color="#2d2d30",
             border_width=1,
-            border_color="#0e639c",  # Blue border to distinguish from apps
+            # Blue border to distinguish games from apps and "None"
+            border_color="#3e3e42" if is_none else "#0e639c",
             height=STATUS_CARD_HEIGHT,
             corner_radius=6
         )
         self.pack_propagate(False)
-        self.game_name = game_name
+        self.game_name = "" if is_none else game_name
         self.browse_callback = browse_callback
         self.radio_callback = radio_callback
         self.is_not_found = False
@@ -40,7 +81,7 @@ class GameCard(ctk.CTkFrame):
             self,
             text="",
             width=20,
-            value=game_name,
+            value=self.game_name,
             variable=radio_variable,
             command=self._on_radio_change
         )
@@ -49,61 +90,46 @@ class GameCard(ctk.CTkFrame):
         # Game name label
         self.name_label = ctk.CTkLabel(
             self,
-            text=self._wrap_text(game_name),
+            text="None" if is_none else _wrap_text(game_name),
             text_color="#ffffff",
-            font=("Segoe UI", 14, "bold"),
+            font=get_font(14, "bold"),
             anchor="w",
             justify="left"
         )
         self.name_label.pack(side="left", padx=(5, 15), pady=10)
 
+        # Browse button, created the first time the game is not found
+        self.browse_btn = None
+
+        if is_none:
+            self.status_label = None
+            return
+
         # Status indicator (will be replaced with Browse button if not found)
         self.status_label = ctk.CTkLabel(
             self,
             text="●",
-            text_color=STATUS_COLORS["idle"],
-            font=("Segoe UI", 40)
+            text_color=STATUS_IDLE,
+            font=get_font(40)
         )
         self.status_label.pack(side="right", padx=15, pady=(5, 15))
 
-        # Browse button (hidden by default)
-        self.browse_btn = ctk.CTkButton(
-            self,
-            text="Browse",
-            fg_color="#555555",
-            hover_color="#666666",
-            text_color="#ffffff",
-            font=("Segoe UI", 13),
-            width=80,
-            height=36,
-            command=self._on_browse_click,
-            corner_radius=6
-        )
-
-    def _wrap_text(self, text: str, max_length: int = 18) -> str:
-        """
-        Wrap text to multiple lines if longer than max_length.
-        Breaks on spaces if possible.
-
-        Args:
-            text: Text to wrap
-            max_length: Maximum characters per line
-
-        Returns:
-            Wrapped text with newlines
-        """
-        if len(text) <= max_length:
-            return text
-
-        # Find the last space before max_length
-        break_point = text.rfind(' ', 0, max_length)
-
-        if break_point == -1:
-            # No space found, just break at max_length
-            return text[:max_length] + '\n' + text[max_length:]
-        else:
-            # Break at the space
-            return text[:break_point] + '\n' + text[break_point + 1:]
+    def _show_browse_button(self):
+        """Show the Browse button, creating it on first use."""
+        if self.browse_btn is None:
+            self.browse_btn = ctk.CTkButton(
+                self,
+                text="Browse",
+                fg_color="#555555",
+                hover_color="#666666",
+                text_color="#ffffff",
+                font=get_font(13),
+                width=80,
+                height=36,
+                command=self._on_browse_click,
+                corner_radius=6
+            )
+        self.browse_btn.pack(side="right", padx=15, pady=10)
 
     def _on_browse_click(self):
         """Handle browse button click."""
@@ -132,13 +158,16 @@ class GameCard(ctk.CTkFrame):
             status: Status string ("idle", "starting", "running", "failed",
                    "stopped", "not_found")
         """
+        # Same status means same look; skip the redraws
+        if status == self.current_status:
+            return
         self.current_status = status  # Store the status
 
         if status == "not_found":
             # Hide status indicator, show Browse button
             self.is_not_found = True
             self.status_label.pack_forget()
-            self.browse_btn.pack(side="right", padx=15, pady=10)
+            self._show_browse_button()
             self.name_label.configure(text_color="#888888")
             # Disable radio button for not found games
             self.radio_btn.configure(state="disabled")
@@ -152,5 +181,5 @@ class GameCard(ctk.CTkFrame):
                 self.radio_btn.configure(state="normal")
                 self.is_not_found = False
 
-            color = STATUS_COLORS.get(status, STATUS_COLORS["idle"])
+            color = STATUS_COLORS.get(status, STATUS_IDLE)
             self.status_label.configure(text_color=color)
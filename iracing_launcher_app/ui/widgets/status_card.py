@@ -3,7 +3,8 @@ Status card widget for companion applications.
 """
 
 import customtkinter as ctk
-from ..constants import STATUS_COLORS, STATUS_CARD_HEIGHT
+from ..constants import STATUS_COLORS, STATUS_IDLE, STATUS_CARD_HEIGHT
+from ..fonts import get_font
 
 
 class StatusCard(ctk.CTkFrame):
@@ -32,6 +33,8 @@ class StatusCard(ctk.CTkFrame):
         self.browse_callback = browse_callback
         self.checkbox_callback = checkbox_callback
         self.is_not_found = False
+        self.current_status = "idle"
+        self._child_count = None  # child_count last passed to set_status
 
         # Checkbox for enabling/disabling this app
         self.checkbox = ctk.CTkCheckBox(
@@ -51,7 +54,7 @@ class StatusCard(ctk.CTkFrame):
             self.text_frame,
             text=app_name,
             text_color="#ffffff",
-            font=("Segoe UI", 14, "bold"),
+            font=get_font(14, "bold"),
             anchor="w"
         )
         self.name_label.pack(side="top", anchor="w", pady=0)
@@ -62,7 +65,7 @@ class StatusCard(ctk.CTkFrame):
             self.text_frame,
             text="No helpers",
             text_color="#888888",
-            font=("Segoe UI", 9),
+            font=get_font(9),
             anchor="w",
             height=12
         )
@@ -72,24 +75,30 @@ class StatusCard(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self,
             text="●",
-            text_color=STATUS_COLORS["idle"],
-            font=("Segoe UI", 40)
+            text_color=STATUS_IDLE,
+            font=get_font(40)
         )
         self.status_label.pack(side="right", padx=15, pady=(5, 15))
 
-        # Browse button (hidden by default)
-        self.browse_btn = ctk.CTkButton(
-            self,
-            text="Browse",
-            fg_color="#555555",
-            hover_color="#666666",
-            text_color="#ffffff",
-            font=("Segoe UI", 13),
-            width=80,
-            height=36,
-            command=self._on_browse_click,
-            corner_radius=6
-        )
+        # Browse button, created the first time the app is not found
+        self.browse_btn = None
+
+    def _show_browse_button(self):
+        """Show the Browse button, creating it on first use."""
+        if self.browse_btn is None:
+            self.browse_btn = ctk.CTkButton(
+                self,
+                text="Browse",
+                fg_color="#555555",
+                hover_color="#666666",
+                text_color="#ffffff",
+                font=get_font(13),
+                width=80,
+                height=36,
+                command=self._on_browse_click,
+                corner_radius=6
+            )
+        self.browse_btn.pack(side="right", padx=15, pady=10)
 
     def _on_browse_click(self):
         """Handle browse button click."""
@@ -122,6 +131,15 @@ class StatusCard(ctk.CTkFrame):
         else:
             self.checkbox.deselect()
 
+    def get_status(self):
+        """
+        Get the current status of the app.
+
+        Returns:
+            Current status string
+        """
+        return self.current_status
+
     def set_status(self, status, child_count=None):
         """
         Update the status indicator color or show Browse button.
@@ -132,11 +150,18 @@ class StatusCard(ctk.CTkFrame):
             child_count: Number of helper processes spawned by the app, if
                 known. Surfaces as a subtitle when status is "running".
         """
+        # Periodic refreshes mostly re-assert the current state; skip the
+        # redraws when nothing shown would change
+        if status == self.current_status and child_count == self._child_count:
+            return
+        self.current_status = status
+        self._child_count = child_count
+
         if status == "not_found":
             # Hide status indicator, show Browse button
             self.is_not_found = True
             self.status_label.pack_forget()
-            self.browse_btn.pack(side="right", padx=15, pady=10)
+            self._show_browse_button()
             self.name_label.configure(text_color="#888888")  # Dim the app name
             # Uncheck and disable checkbox for not found apps
             self.checkbox.deselect()
@@ -152,7 +177,7 @@ class StatusCard(ctk.CTkFrame):
                 self.checkbox.configure(state="normal")
                 self.is_not_found = False
 
-            color = STATUS_COLORS.get(status, STATUS_COLORS["idle"])
+            color = STATUS_COLORS.get(status, STATUS_IDLE)
             self.status_label.configure(text_color=color)
 
             if status == "running" and child_count:
@@ -3,67 +3,229 @@ Path detection utilities for finding application executables.
 """
 
 import os
-from pathlib import Path
-from typing import Optional, List
-import winshell
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, List, Sequence, Tuple
 
 
-def find_shortcut_target(
-    shortcut_names: List[str],
-    is_game: bool = False
-) -> Optional[str]:
+_START_MENU_SUBPATH = os.path.join('Microsoft', 'Windows', 'Start Menu', 'Programs')
+
+# These folders don't move while the launcher is running; resolve them once.
+_APPDATA = os.environ.get('APPDATA', '')
+_PROGRAMDATA = os.environ.get('ProgramData', '')
+
+# Per-user and all-users Start Menu Programs folders, in priority order
+_START_MENU_ROOTS: Tuple[str, ...] = tuple(
+    os.path.join(base, _START_MENU_SUBPATH)
+    for base in (_APPDATA, _PROGRAMDATA)
+    if base
+)
+
+# (folder mtimes, index) from the last Start Menu scan. The folder mtimes
+# pair every walked folder, roots included, with its mtime; the index maps
+# a lowercased .lnk file name to (root position, full path) pairs.
+_shortcut_index: Tuple[
+    Tuple[Tuple[str, float], ...], Dict[str, List[Tuple[int, str]]]
+] = ((), {})
+
+# How long (seconds) the index is trusted before the folder mtimes are
+# checked again. One check pass looks up several apps and games within a
+# second, so their lookups share a single validation.
+_INDEX_RECHECK_SECS = 5.0
+
+# time.monotonic() when the index was last built or validated
+_index_checked_at = float("-inf")
+
+# Resolved app shortcuts: .lnk path -> (mtime, size, target path). Reading
+# a shortcut goes through COM, so a target is only re-read once the .lnk
+# file itself has changed.
+_lnk_targets: Dict[str, Tuple[float, int, str]] = {}
+
+# Per-thread (IShellLink, IPersistFile) pair. COM objects belong to the
+# thread that created them, and searches run on worker threads.
+_com = threading.local()
+
+_STGM_READ = 0x0
+_SLGP_UNCPRIORITY = 0x2
+
+
+def _mtime(path: str) -> float:
     """
-    Find application/game path by reading Start Menu shortcuts.
+    Get a folder's modification time.
 
     Args:
-        shortcut_names: List of potential shortcut names to search for
-        is_game: True if searching for game, False for app
+        path: Folder to check
 
     Returns:
-        Path to .lnk file (for games) or target .exe (for apps) if found, None otherwise
+        The mtime, or 0.0 if the folder can't be read
     """
-    # Start Menu locations to search
-    start_menu_paths = [
-        Path(os.getenv('APPDATA')) / 'Microsoft' / 'Windows' / 'Start Menu' / 'Programs',
-        Path(os.getenv('ProgramData')) / 'Microsoft' / 'Windows' / 'Start Menu' / 'Programs'
-    ]
-
-    # Search for shortcuts
-    for start_menu in start_menu_paths:
-        if not start_menu.exists():
-            continue
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
 
-        # Search recursively for matching shortcut names
-        for shortcut_name in shortcut_names:
-            for shortcut_path in start_menu.rglob(shortcut_name):
-                try:
-                    # For games, return the .lnk path itself to preserve launch parameters
-                    if is_game:
-                        if os.path.exists(str(shortcut_path)):
-                            return str(shortcut_path)
-                    else:
-                        # For apps, return the target .exe path
-                        shortcut = winshell.shortcut(str(shortcut_path))
-                        target_path = shortcut.path
-                        if os.path.exists(target_path):
-                            return target_path
-                except Exception:
-                    continue
 
-    return None
+def _scan_start_menu(roots: Tuple[str, ...]) -> Dict[str, List[Tuple[int, str]]]:
+    """
+    Index every shortcut below the Start Menu roots in a single walk.
 
+    Each tree is traversed once breadth-first with ``os.scandir``. The
+    index is reused until the modification time of a root or of any
+    folder below it changes, which is when a shortcut is added, removed
+    or renamed in that folder. Those mtimes are checked at most once
+    every _INDEX_RECHECK_SECS, not on every lookup.
 
-def find_path_in_list(paths: List[str]) -> Optional[str]:
+    Args:
+        roots: Start Menu folders to scan, in priority order
+
+    Returns:
+        Mapping of lowercased .lnk name to (root position, full path) pairs
     """
-    Find the first existing path from a list of potential paths.
+    global _shortcut_index, _index_checked_at
+
+    cached_mtimes, index = _shortcut_index
+    now = time.monotonic()
+    if cached_mtimes and tuple(path for path, _ in cached_mtimes[:len(roots)]) == roots:
+        if now - _index_checked_at < _INDEX_RECHECK_SECS:
+            return index
+        if all(_mtime(path) == mtime for path, mtime in cached_mtimes):
+            _index_checked_at = now
+            return index
+
+    folder_mtimes = [(root, _mtime(root)) for root in roots]
+    index = {}
+    for position, root in enumerate(roots):
+        pending = deque([root])
+        while pending:
+            try:
+                with os.scandir(pending.popleft()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                                # Comes from the directory listing on Windows,
+                                # so this costs no extra system call
+                                folder_mtimes.append((entry.path, entry.stat().st_mtime))
+                            elif entry.name.lower().endswith('.lnk'):
+                                index.setdefault(entry.name.lower(), []).append(
+                                    (position, entry.path)
+                                )
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    _shortcut_index = (tuple(folder_mtimes), index)
+    _index_checked_at = now
+    return index
+
+
+def load_shortcut_targets(targets: Dict[str, Tuple[float, int, str]]):
+    """
+    Seed the shortcut resolution cache, e.g. from config.ini.
 
     Args:
-        paths: List of paths to check
+        targets: Mapping of .lnk path to (mtime, size, target path)
+    """
+    _lnk_targets.update(targets)
+
+
+def get_shortcut_targets() -> Dict[str, Tuple[float, int, str]]:
+    """
+    Get a copy of the shortcut resolution cache for persisting.
 
     Returns:
-        First existing path, or None if none exist
+        Mapping of .lnk path to (mtime, size, target path)
     """
-    for path in paths:
-        if os.path.exists(path):
-            return path
+    return dict(_lnk_targets)
+
+
+def _get_shell_link():
+    """
+    Get this thread's ShellLink object, creating it on first use.
+
+    One object is loaded with each shortcut in turn, rather than creating
+    a new COM instance per shortcut.
+
+    Returns:
+        (IShellLink, IPersistFile) interfaces of the same ShellLink object
+    """
+    pair = getattr(_com, "shell_link", None)
+    if pair is None:
+        # pywin32 is only imported once a shortcut actually needs reading
+        import pythoncom
+        from win32com.shell import shell
+
+        # Worker threads need their own COM initialization
+        pythoncom.CoInitialize()
+        shell_link = pythoncom.CoCreateInstance(
+            shell.CLSID_ShellLink, None,
+            pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink
+        )
+        pair = (shell_link, shell_link.QueryInterface(pythoncom.IID_IPersistFile))
+        _com.shell_link = pair
+    return pair
+
+
+def _resolve_lnk(shortcut_path: str) -> str:
+    """
+    Read the target of a .lnk file, reusing the cached result if unchanged.
+
+    Args:
+        shortcut_path: Full path to the .lnk file
+
+    Returns:
+        Target path stored in the shortcut
+    """
+    stat = os.stat(shortcut_path)
+    cached = _lnk_targets.get(shortcut_path)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        return cached[2]
+
+    shell_link, persist_file = _get_shell_link()
+    persist_file.Load(shortcut_path, _STGM_READ)
+    target_path = shell_link.GetPath(_SLGP_UNCPRIORITY)[0]
+    _lnk_targets[shortcut_path] = (stat.st_mtime, stat.st_size, target_path)
+    return target_path
+
+
+def find_shortcut_target(
+    shortcut_names: Sequence[str],
+    is_game: bool = False
+) -> Optional[str]:
+    """
+    Find application/game path by reading Start Menu shortcuts.
+
+    Args:
+        shortcut_names: List of potential shortcut names to search for
+        is_game: True if searching for game, False for app
+
+    Returns:
+        Path to .lnk file (for games) or target .exe (for apps) if found, None otherwise
+    """
+    index = _scan_start_menu(_START_MENU_ROOTS)
+
+    # Same preference as before: per-user Start Menu first, then the
+    # order of names in shortcut_names.
+    candidates = []
+    for name_position, shortcut_name in enumerate(shortcut_names):
+        for root_position, shortcut_path in index.get(shortcut_name.lower(), ()):
+            candidates.append((root_position, name_position, shortcut_path))
+    candidates.sort(key=lambda candidate: candidate[:2])
+
+    for _, _, shortcut_path in candidates:
+        try:
+            # For games, return the .lnk path itself to preserve launch parameters
+            if is_game:
+                if os.path.exists(shortcut_path):
+                    return shortcut_path
+            else:
+                # For apps, return the target .exe path
+                target_path = _resolve_lnk(shortcut_path)
+                if os.path.exists(target_path):
+                    return target_path
+        except Exception:
+            continue
+
     return None
@@ -2,7 +2,64 @@
 Steam registry utilities for detecting installed games.
 """
 
-import winreg
+import logging
+import time
+from typing import FrozenSet, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+_UNINSTALL_PATH = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+_STEAM_APP_PREFIX = "Steam App "
+
+# How long (seconds) an enumeration of installed Steam apps is reused
+STEAM_APPIDS_TTL = 30.0
+
+# (monotonic timestamp, app IDs) from the last registry enumeration
+_steam_appids: Tuple[float, FrozenSet[str]] = (float("-inf"), frozenset())
+
+
+def _installed_steam_appids() -> FrozenSet[str]:
+    """
+    Get the app IDs of all Steam games listed under the Uninstall key.
+
+    The key is enumerated once and the result reused for
+    STEAM_APPIDS_TTL seconds, instead of opening one subkey per game.
+
+    Returns:
+        Frozen set of installed Steam app IDs
+    """
+    global _steam_appids
+
+    taken_at, appids = _steam_appids
+    now = time.monotonic()
+    if now - taken_at < STEAM_APPIDS_TTL:
+        return appids
+
+    import winreg
+
+    found = set()
+    try:
+        # Only subkey names are read, so ask for just enumeration access
+        with winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE, _UNINSTALL_PATH, 0,
+            winreg.KEY_ENUMERATE_SUB_KEYS
+        ) as key:
+            index = 0
+            while True:
+                try:
+                    name = winreg.EnumKey(key, index)
+                except OSError:
+                    break
+                index += 1
+                if name.startswith(_STEAM_APP_PREFIX):
+                    found.add(name[len(_STEAM_APP_PREFIX):])
+    except OSError as e:
+        logger.warning("Registry: could not read installed programs: %s", e)
+
+    appids = frozenset(found)
+    _steam_appids = (now, appids)
+    return appids
 
 
 def check_steam_game_installed(appid: str) -> bool:
@@ -15,12 +72,4 @@ def check_steam_game_installed(appid: str) -> bool:
     Returns:
         True if game is installed, False otherwise
     """
-    try:
-        key_path = rf"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Steam App {appid}"
-        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path, 0, winreg.KEY_READ)
-        winreg.CloseKey(key)
-        print(f"[Registry] Steam App {appid} found in registry")
-        return True
-    except WindowsError:
-        print(f"[Registry] Steam App {appid} not found in registry")
-        return False
+    return str(appid) in _installed_steam_appids()
@@ -0,0 +1,199 @@
+"""
+Process table walk via the Windows Toolhelp32 API.
+
+One CreateToolhelp32Snapshot call copies every process's PID and exe name,
+without opening each process the way a psutil walk does. Also wraps
+TerminateProcess for killing by PID, and WaitForInputIdle for waiting on
+freshly launched apps.
+"""
+
+import sys
+import time
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+
+_TH32CS_SNAPPROCESS = 0x00000002
+_MAX_PATH = 260
+_PROCESS_TERMINATE = 0x0001
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_SYNCHRONIZE = 0x00100000
+
+# Lazily created (kernel32, PROCESSENTRY32W, INVALID_HANDLE_VALUE)
+_api = None
+
+
+def _load_api():
+    """
+    Load kernel32 and declare the Toolhelp32 signatures on first use.
+
+    Returns:
+        (kernel32, PROCESSENTRY32W structure class, INVALID_HANDLE_VALUE)
+
+    Raises:
+        OSError: If not running on Windows
+    """
+    global _api
+    if _api is not None:
+        return _api
+    if sys.platform != "win32":
+        raise OSError("Toolhelp32 is only available on Windows")
+
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * _MAX_PATH),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    entry_ptr = ctypes.POINTER(PROCESSENTRY32W)
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, entry_ptr]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, entry_ptr]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    kernel32.TerminateProcess.restype = wintypes.BOOL
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+
+    invalid_handle = wintypes.HANDLE(-1).value
+    _api = (kernel32, PROCESSENTRY32W, invalid_handle)
+    return _api
+
+
+def iter_processes() -> Iterator[Tuple[int, str]]:
+    """
+    Walk the process table with a single Toolhelp32 snapshot.
+
+    Yields:
+        (pid, lowercased executable name) for every process
+
+    Raises:
+        OSError: If not on Windows or the snapshot could not be taken
+    """
+    import ctypes
+
+    kernel32, PROCESSENTRY32W, invalid_handle = _load_api()
+
+    handle = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if not handle or handle == invalid_handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(handle, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile:
+                yield entry.th32ProcessID, entry.szExeFile.lower()
+            found = kernel32.Process32NextW(handle, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def terminate_processes(pids: Iterable[int], timeout: float) -> Set[int]:
+    """
+    Terminate processes by PID and wait for them to exit.
+
+    Every process is terminated before any wait starts, so their teardowns
+    overlap. Processes that are gone or can't be opened are skipped.
+
+    Args:
+        pids: Process IDs to terminate
+        timeout: Longest total time to wait for them to exit (seconds)
+
+    Returns:
+        The PIDs that were terminated
+
+    Raises:
+        OSError: If not running on Windows
+    """
+    kernel32, _, _ = _load_api()
+
+    handles: Dict[int, int] = {}
+    try:
+        for pid in pids:
+            handle = kernel32.OpenProcess(
+                _PROCESS_TERMINATE | _SYNCHRONIZE, False, pid
+            )
+            if not handle:
+                continue
+            if kernel32.TerminateProcess(handle, 1):
+                handles[pid] = handle
+            else:
+                kernel32.CloseHandle(handle)
+
+        deadline = time.monotonic() + timeout
+        for handle in handles.values():
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            kernel32.WaitForSingleObject(handle, remaining_ms)
+    finally:
+        for handle in handles.values():
+            kernel32.CloseHandle(handle)
+    return set(handles)
+
+
+# Lazily created user32 with WaitForInputIdle declared
+_user32 = None
+
+_WAIT_TIMEOUT = 0x00000102
+
+
+def wait_for_input_idle(pid: int, timeout_ms: int) -> bool:
+    """
+    Wait until a newly started GUI process is ready for input.
+
+    Returns as soon as the process's message loop goes idle, which for most
+    apps is well before a fixed launch delay would have elapsed.
+
+    Args:
+        pid: Process ID, e.g. ``Popen.pid``
+        timeout_ms: Longest time to wait, in milliseconds
+
+    Returns:
+        True if the process went idle or the timeout elapsed, False if the
+        wait does not apply (e.g. console processes, or processes that have
+        exited or can't be opened)
+
+    Raises:
+        OSError: If not running on Windows
+    """
+    global _user32
+    if _user32 is None:
+        if sys.platform != "win32":
+            raise OSError("WaitForInputIdle is only available on Windows")
+
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        user32.WaitForInputIdle.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        user32.WaitForInputIdle.restype = wintypes.DWORD
+        _user32 = user32
+
+    kernel32, _, _ = _load_api()
+    handle = kernel32.OpenProcess(
+        _SYNCHRONIZE | _PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+    )
+    if not handle:
+        return False
+    try:
+        result = _user32.WaitForInputIdle(handle, timeout_ms)
+    finally:
+        kernel32.CloseHandle(handle)
+    return result in (0, _WAIT_TIMEOUT)
@@ -0,0 +1,48 @@
+"""
+Tests for IniConfig boolean parsing of checkbox settings.
+"""
+
+import os
+import tempfile
+import unittest
+
+from iracing_launcher_app.core.ini_config import IniConfig
+
+
+class GetBooleanTests(unittest.TestCase):
+    """Checkbox states written as 1/0, or as True/False by older versions."""
+
+    def _read(self, text: str) -> IniConfig:
+        """Parse INI text through a temporary file."""
+        fd, path = tempfile.mkstemp(suffix=".ini")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            config = IniConfig()
+            config.read(path)
+            return config
+        finally:
+            os.remove(path)
+
+    def test_current_format(self):
+        config = self._read("[Settings]\nracelab_enabled = 1\ncrewchief_enabled = 0\n")
+        self.assertIs(config.getboolean("Settings", "racelab_enabled"), True)
+        self.assertIs(config.getboolean("Settings", "crewchief_enabled"), False)
+
+    def test_legacy_format(self):
+        config = self._read("[Settings]\nracelab_enabled = True\ncrewchief_enabled = False\n")
+        self.assertIs(config.getboolean("Settings", "racelab_enabled"), True)
+        self.assertIs(config.getboolean("Settings", "crewchief_enabled"), False)
+
+    def test_missing_uses_fallback(self):
+        config = self._read("[Settings]\n")
+        self.assertIs(config.getboolean("Settings", "racelab_enabled", fallback=True), True)
+
+    def test_invalid_raises(self):
+        config = self._read("[Settings]\nracelab_enabled = maybe\n")
+        with self.assertRaises(ValueError):
+            config.getboolean("Settings", "racelab_enabled")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,33 +15,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from version import __version__
 
 
-def parse_version(version_string):
-    """
-    Parse version string into components.
-
-    Args:
-        version_string: Version in format "1.4.0" or "1.4.0-beta"
-
-    Returns:
-        tuple: (major, minor, patch, prerelease)
-    """
-    # Remove any prerelease suffix
-    match = re.match(r'(\d+)\.(\d+)\.(\d+)(?:-(.+))?', version_string)
-    if not match:
-        raise ValueError(f"Invalid version format: {version_string}")
+# Matches "1.4.0" or "1.4.0-beta" at the start of a version string
+_VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)(?:-(.+))?')
 
-    major, minor, patch, prerelease = match.groups()
-    return int(major), int(minor), int(patch), prerelease or ""
-
-
-def create_version_info_file():
-    """Create version_info.txt file for PyInstaller."""
-    major, minor, patch, prerelease = parse_version(__version__)
+# Matches the AppVersion line of the Inno Setup script
+_APP_VERSION_RE = re.compile(r'AppVersion=.*')
 
-    # Windows expects 4 numbers for version
-    build = 0  # Can be incremented for builds of the same version
-
-    version_info = f"""# UTF-8
+# PyInstaller version resource; filled in by create_version_info_file
+_VERSION_INFO_TEMPLATE = """# UTF-8
 #
 # For more details about fixed file info:
 # https://msdn.microsoft.com/en-us/library/ms646997.aspx
@@ -75,18 +56,53 @@ VSVersionInfo(
         u'040904B0',
         [StringStruct(u'CompanyName', u'Tobias Termeczky'),
         StringStruct(u'FileDescription', u'iRacing Companion Launcher'),
-        StringStruct(u'FileVersion', u'{__version__}'),
+        StringStruct(u'FileVersion', u'{version}'),
         StringStruct(u'InternalName', u'iRacing Companion Launcher'),
         StringStruct(u'LegalCopyright', u'© 2026 Tobias Termeczky'),
         StringStruct(u'OriginalFilename', u'iRacing Companion Launcher.exe'),
         StringStruct(u'ProductName', u'iRacing Companion Launcher'),
-        StringStruct(u'ProductVersion', u'{__version__}')])
+        StringStruct(u'ProductVersion', u'{version}')])
       ]),
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )
 """
 
+
+def parse_version(version_string):
+    """
+    Parse version string into components.
+
+    Args:
+        version_string: Version in format "1.4.0" or "1.4.0-beta"
+
+    Returns:
+        tuple: (major, minor, patch, prerelease)
+    """
+    # Remove any prerelease suffix
+    match = _VERSION_RE.match(version_string)
+    if not match:
+        raise ValueError(f"Invalid version format: {version_string}")
+
+    major, minor, patch, prerelease = match.groups()
+    return int(major), int(minor), int(patch), prerelease or ""
+
+
+def create_version_info_file():
+    """Create version_info.txt file for PyInstaller."""
+    major, minor, patch, prerelease = parse_version(__version__)
+
+    # Windows expects 4 numbers for version
+    build = 0  # Can be incremented for builds of the same version
+
+    version_info = _VERSION_INFO_TEMPLATE.format(
+        major=major,
+        minor=minor,
+        patch=patch,
+        build=build,
+        version=__version__,
+    )
+
     with open('version_info.txt', 'w', encoding='utf-8') as f:
         f.write(version_info)
 
@@ -111,11 +127,7 @@ def update_inno_setup():
         inno_version += f"-{prerelease}"
 
     # Replace AppVersion line
-    content = re.sub(
-        r'AppVersion=.*',
-        f'AppVersion={inno_version}',
-        content
-    )
+    content = _APP_VERSION_RE.sub(f'AppVersion={inno_version}', content)
 
     # Write back
     with open(iss_file, 'w', encoding='utf-8') as f: